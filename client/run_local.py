@@ -3,53 +3,183 @@
 Local test runner for the BobaVision client.
 
 This script runs the client with keyboard support for testing without GPIO hardware.
-Press § to simulate button presses.
+Press SPACE (or the key set in BOBAVISION_SIMKEY) to simulate button presses.
 """
 import logging
 import os
 import sys
 import threading
+from dataclasses import asdict
 from typing import Optional
 
+# evdev reads key events straight from the kernel on Linux (no X11 needed)
+try:
+    import evdev
+    from evdev import ecodes
+except ImportError:
+    evdev = None
+
+# pynput is the fallback for macOS/Windows or when evdev has no usable device
 try:
     from pynput import keyboard
-except ImportError as e:
-    print("ERROR: pynput is not installed or not available")
-    print("Please install dependencies with: uv sync")
-    print(f"Details: {e}")
-    sys.exit(1)
+except ImportError:
+    keyboard = None
 except Exception as e:
-    print("ERROR: pynput failed to initialize")
+    print("WARNING: pynput failed to initialize")
     print("This may happen in headless environments without X11/display")
-    print("On macOS/Linux with GUI, ensure you have the necessary permissions")
     print(f"Details: {e}")
-    sys.exit(1)
+    keyboard = None
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from src.config import ClientConfig
 from src.main import ClientApp
 
 logger = logging.getLogger(__name__)
 
 
+# Keys whose evdev code name isn't simply KEY_<character>
+EVDEV_KEY_NAMES = {
+    "space": "KEY_SPACE",
+    "§": "KEY_GRAVE",  # Key left of 1 on ISO layouts
+}
+
+
+def key_label(sim_key: str) -> str:
+    """Human-readable label for a trigger key (e.g., "SPACE" or "§")."""
+    return sim_key.upper() if sim_key == "space" else sim_key
+
+
+class EvdevButtonSimulator:
+    """
+    Simulates GPIO button presses by reading a Linux input device.
+
+    Listens for trigger key presses and triggers the callback. Events are
+    read with a blocking read on the device, so no X11 session is needed.
+    """
+
+    def __init__(self, callback, device_path: str, sim_key: str = "space"):
+        """
+        Initialize the evdev simulator.
+
+        Args:
+            callback: Function to call when the trigger key is pressed
+            device_path: Path to the input device (e.g., "/dev/input/event0")
+            sim_key: Trigger key, "space" or a single character (default: "space")
+        """
+        self.callback = callback
+        self.device_path = device_path
+        self.sim_key = sim_key
+        self.trigger_code = self.key_code(sim_key)
+        self.device = None
+        self.thread: Optional[threading.Thread] = None
+        logger.info(
+            f"Evdev button simulator initialized on {device_path} "
+            f"(press {key_label(sim_key)} to simulate button)"
+        )
+
+    @staticmethod
+    def key_code(sim_key: str) -> Optional[int]:
+        """
+        Map a trigger key to its evdev key code.
+
+        Args:
+            sim_key: Trigger key, "space" or a single character
+
+        Returns:
+            int or None: evdev key code, or None if evdev is unavailable or
+            the key has no known code
+        """
+        if evdev is None:
+            return None
+
+        name = EVDEV_KEY_NAMES.get(sim_key, f"KEY_{sim_key.upper()}")
+        return getattr(ecodes, name, None)
+
+    @classmethod
+    def find_keyboard(cls, sim_key: str = "space") -> Optional[str]:
+        """
+        Find an input device that can emit the trigger key.
+
+        Args:
+            sim_key: Trigger key, "space" or a single character
+
+        Returns:
+            str or None: Device path, or None if evdev is unavailable or
+            no readable keyboard was found
+        """
+        trigger_code = cls.key_code(sim_key)
+        if trigger_code is None:
+            return None
+
+        for path in evdev.list_devices():
+            try:
+                device = evdev.InputDevice(path)
+            except OSError:
+                continue
+            keys = device.capabilities().get(ecodes.EV_KEY, [])
+            device.close()
+            if trigger_code in keys:
+                return path
+
+        return None
+
+    def start(self):
+        """Start reading key events in a background thread."""
+        self.device = evdev.InputDevice(self.device_path)
+        self.thread = threading.Thread(target=self._read_loop, daemon=True)
+        self.thread.start()
+        logger.info("Evdev listener started")
+
+    def stop(self):
+        """Stop reading key events."""
+        if self.device:
+            self.device.close()
+            self.device = None
+            logger.info("Evdev listener stopped")
+
+    def _read_loop(self):
+        """Block on the input device and fire the callback on key down."""
+        try:
+            for event in self.device.read_loop():
+                if (event.type == ecodes.EV_KEY
+                        and event.code == self.trigger_code
+                        and event.value == 1):
+                    logger.info(f"{key_label(self.sim_key)} pressed - triggering button callback")
+                    try:
+                        self.callback()
+                    except Exception as e:
+                        logger.error(f"Error in keyboard handler: {e}", exc_info=True)
+        except OSError:
+            # Device was closed by stop()
+            pass
+
+    def close(self):
+        """Alias for stop() to match ButtonHandler interface."""
+        self.stop()
+
+
 class KeyboardButtonSimulator:
     """
     Simulates GPIO button presses using keyboard input.
 
-    Listens for § key presses and triggers the callback.
+    Listens for trigger key presses and triggers the callback. Used on
+    macOS/Windows, where evdev is not available.
     """
 
-    def __init__(self, callback):
+    def __init__(self, callback, sim_key: str = "space"):
         """
         Initialize the keyboard simulator.
 
         Args:
-            callback: Function to call when § is pressed
+            callback: Function to call when the trigger key is pressed
+            sim_key: Trigger key, "space" or a single character (default: "space")
         """
         self.callback = callback
-        self.listener: Optional[keyboard.Listener] = None
-        logger.info("Keyboard button simulator initialized (press § to simulate button)")
+        self.sim_key = sim_key
+        self.listener: Optional["keyboard.Listener"] = None
+        logger.info(f"Keyboard button simulator initialized (press {key_label(sim_key)} to simulate button)")
 
     def start(self):
         """Start listening for keyboard input."""
@@ -63,6 +193,12 @@ class KeyboardButtonSimulator:
             self.listener.stop()
             logger.info("Keyboard listener stopped")
 
+    def _is_trigger(self, key) -> bool:
+        """Check whether a pynput key matches the trigger key."""
+        if self.sim_key == "space":
+            return key == keyboard.Key.space
+        return getattr(key, 'char', None) == self.sim_key
+
     def _on_key_press(self, key):
         """
         Handle key press events.
@@ -71,9 +207,8 @@ class KeyboardButtonSimulator:
             key: The key that was pressed
         """
         try:
-            # Check if § was pressed
-            if hasattr(key, 'char') and key.char == '§':
-                logger.info("§ pressed - triggering button callback")
+            if self._is_trigger(key):
+                logger.info(f"{key_label(self.sim_key)} pressed - triggering button callback")
                 self.callback()
         except Exception as e:
             logger.error(f"Error in keyboard handler: {e}", exc_info=True)
@@ -88,11 +223,14 @@ class LocalClientApp(ClientApp):
     Modified client app that uses keyboard input instead of GPIO.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, sim_key: str = "space", **kwargs):
         """
         Initialize the local client app.
 
         This replaces the GPIO button handler with a keyboard simulator.
+
+        Args:
+            sim_key: Trigger key, "space" or a single character (default: "space")
         """
         # Initialize parent (this will create a non-functional ButtonHandler)
         super().__init__(*args, **kwargs)
@@ -101,7 +239,19 @@ class LocalClientApp(ClientApp):
         original_callback = self.button_handler.callback
         self.button_handler.close()  # Clean up GPIO attempt
 
-        self.keyboard_simulator = KeyboardButtonSimulator(callback=original_callback)
+        self.sim_key = sim_key
+        device_path = EvdevButtonSimulator.find_keyboard(sim_key)
+        if device_path:
+            self.keyboard_simulator = EvdevButtonSimulator(
+                callback=original_callback,
+                device_path=device_path,
+                sim_key=sim_key
+            )
+        else:
+            self.keyboard_simulator = KeyboardButtonSimulator(
+                callback=original_callback,
+                sim_key=sim_key
+            )
 
         logger.info("LocalClientApp initialized with keyboard input")
 
@@ -109,7 +259,7 @@ class LocalClientApp(ClientApp):
         """Start the client app and keyboard listener."""
         super().start()
         self.keyboard_simulator.start()
-        logger.info("Press § to simulate button presses")
+        logger.info(f"Press {key_label(self.sim_key)} to simulate button presses")
 
     def stop(self):
         """Stop the client app and keyboard listener."""
@@ -123,6 +273,14 @@ def main():
 
     Reads configuration from environment variables and starts the app.
     """
+    sim_key = os.getenv("BOBAVISION_SIMKEY", "space")
+
+    if keyboard is None and EvdevButtonSimulator.find_keyboard(sim_key) is None:
+        print("ERROR: no keyboard input backend available")
+        print("Please install dependencies with: uv sync")
+        print("On Linux, make sure your user can read /dev/input (e.g., add it to the 'input' group)")
+        sys.exit(1)
+
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
@@ -130,32 +288,24 @@ def main():
     )
 
     # Read configuration from environment
-    server_url = os.getenv("BOBAVISION_SERVER_URL", "http://localhost:8000")
-    client_id = os.getenv("BOBAVISION_CLIENT_ID", "local-test-client")
-    web_server_port = int(os.getenv("BOBAVISION_WEB_PORT", "5000"))
-    gpio_pin = int(os.getenv("BOBAVISION_GPIO_PIN", "17"))
+    config = ClientConfig.from_env(default_client_id="local-test-client")
 
     print("=" * 70)
     print("BobaVision Local Test Client")
     print("=" * 70)
-    print(f"Server URL:    {server_url}")
-    print(f"Client ID:     {client_id}")
-    print(f"Web Port:      {web_server_port}")
-    print(f"GPIO Pin:      {gpio_pin} (simulated with keyboard)")
+    print(f"Server URL:    {config.server_url}")
+    print(f"Client ID:     {config.client_id}")
+    print(f"Web Port:      {config.web_server_port}")
+    print(f"GPIO Pin:      {config.gpio_pin} (simulated with keyboard)")
     print()
     print("Controls:")
-    print("  § - Simulate button press")
+    print(f"  {key_label(sim_key)} - Simulate button press")
     print("  Ctrl+C - Quit")
     print("=" * 70)
     print()
 
     # Create and run the application
-    app = LocalClientApp(
-        server_url=server_url,
-        client_id=client_id,
-        web_server_port=web_server_port,
-        gpio_pin=gpio_pin
-    )
+    app = LocalClientApp(**asdict(config), sim_key=sim_key)
 
     app.run()
 
@@ -0,0 +1,45 @@
+"""
+Client configuration loaded from environment variables.
+
+This module provides a single typed configuration object shared by the
+production entry point (src/main.py) and the local runner (run_local.py).
+"""
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ClientConfig:
+    """Configuration for the client application."""
+
+    server_url: str
+    client_id: str
+    web_server_port: int
+    gpio_pin: int
+    persistent_player: bool = False
+
+    @classmethod
+    def from_env(cls, default_client_id: str = "default-client") -> "ClientConfig":
+        """
+        Build the configuration from environment variables.
+
+        Reads BOBAVISION_SERVER_URL, BOBAVISION_CLIENT_ID,
+        BOBAVISION_WEB_PORT, BOBAVISION_GPIO_PIN and
+        BOBAVISION_PERSISTENT_PLAYER ("1" to enable).
+
+        Args:
+            default_client_id: Client ID to use if BOBAVISION_CLIENT_ID is not set
+
+        Returns:
+            ClientConfig: Parsed configuration
+
+        Raises:
+            ValueError: If the port or GPIO pin is not an integer
+        """
+        return cls(
+            server_url=os.getenv("BOBAVISION_SERVER_URL", "http://localhost:8000"),
+            client_id=os.getenv("BOBAVISION_CLIENT_ID", default_client_id),
+            web_server_port=int(os.getenv("BOBAVISION_WEB_PORT", "5000")),
+            gpio_pin=int(os.getenv("BOBAVISION_GPIO_PIN", "17")),
+            persistent_player=os.getenv("BOBAVISION_PERSISTENT_PLAYER", "0") == "1",
+        )
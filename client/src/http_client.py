@@ -4,8 +4,10 @@ HTTP client for communicating with the media server.
 This module provides an API client that fetches video information
 from the FastAPI server's /api/next endpoint.
 """
+import threading
+import time
 import httpx
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Optional
 
 
 class ApiClient:
@@ -25,6 +27,18 @@ class ApiClient:
         self.client_id = client_id
         self.timeout = timeout
 
+        # Persistent client so repeated requests reuse the same connection
+        # (HTTP keep-alive) instead of reconnecting on every button press
+        self._client = httpx.Client(
+            base_url=self.server_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=4)
+        )
+
+        # Last time the server was known to be healthy (time.monotonic())
+        self._last_health_ok_ts: Optional[float] = None
+        self._health_ttl = 30.0
+
     def get_next_video(self) -> Dict[str, Any]:
         """
         Fetch the next video to play from the server.
@@ -42,11 +56,11 @@ class ApiClient:
             ValueError: If response contains invalid JSON
             Exception: For other network/connection errors
         """
-        # Build the API endpoint URL
-        endpoint = f"{self.server_url}/api/next?client_id={self.client_id}"
-
-        # Make HTTP GET request
-        response = httpx.get(endpoint, timeout=self.timeout)
+        # Make HTTP GET request over the pooled connection
+        response = self._client.get(
+            "/api/next",
+            params={"client_id": self.client_id}
+        )
 
         # Raise exception for HTTP errors (4xx, 5xx)
         response.raise_for_status()
@@ -57,17 +71,62 @@ class ApiClient:
         # Add full URL to video data
         video_data["full_url"] = f"{self.server_url}{video_data['url']}"
 
+        # A successful request proves the server is healthy
+        self._last_health_ok_ts = time.monotonic()
+
         return video_data
 
     def check_server_health(self) -> bool:
         """
         Check if the server is reachable and responding.
 
+        A healthy result is cached for a short time, so repeated checks
+        don't hit the network.
+
         Returns:
             bool: True if server is healthy, False otherwise
         """
+        if (self._last_health_ok_ts is not None
+                and time.monotonic() - self._last_health_ok_ts < self._health_ttl):
+            return True
+
         try:
-            response = httpx.get(f"{self.server_url}/", timeout=5)
-            return response.status_code == 200
+            response = self._client.get("/", timeout=5)
         except Exception:
             return False
+
+        if response.status_code != 200:
+            return False
+
+        self._last_health_ok_ts = time.monotonic()
+        return True
+
+    def check_server_health_async(
+        self,
+        callback: Optional[Callable[[bool], None]] = None
+    ) -> threading.Thread:
+        """
+        Check server health in a background thread.
+
+        Args:
+            callback: Optional function called with the health result
+
+        Returns:
+            threading.Thread: The thread running the check
+        """
+        def probe():
+            healthy = self.check_server_health()
+            if callback:
+                callback(healthy)
+
+        thread = threading.Thread(target=probe, daemon=True)
+        thread.start()
+        return thread
+
+    def close(self):
+        """
+        Close the underlying HTTP connection pool.
+
+        Should be called when the client is no longer needed.
+        """
+        self._client.close()
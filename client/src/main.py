@@ -5,13 +5,19 @@ This module orchestrates the button handler, state machine, API client,
 video player, and web server to create a complete kid-friendly media player.
 """
 import logging
+import os
+import platform
+import shutil
+import subprocess
 import threading
-import time
-from typing import Optional
+import webbrowser
+from dataclasses import asdict
+from typing import List, Optional, Tuple
 
+from src.config import ClientConfig
 from src.web_server import WebServer
 from src.http_client import ApiClient
-from src.player import Player
+from src.player import MpvIpcPlayer, Player
 from src.button import ButtonHandler
 from src.state_machine import StateMachine, State
 
@@ -35,7 +41,8 @@ class ClientApp:
         server_url: str,
         client_id: str,
         web_server_port: int = 5000,
-        gpio_pin: int = 17
+        gpio_pin: int = 17,
+        persistent_player: bool = False
     ):
         """
         Initialize the client application.
@@ -45,23 +52,34 @@ class ClientApp:
             client_id: Unique identifier for this client
             web_server_port: Port for the local web server (default: 5000)
             gpio_pin: GPIO pin number for the button (default: 17)
+            persistent_player: Keep one mpv process running between videos
+                instead of starting one per video (default: False)
         """
         self.server_url = server_url
         self.client_id = client_id
         self.running = False
 
+        # Set by stop() to wake up run()
+        self._shutdown_event = threading.Event()
+
         # Initialize components
         self.web_server = WebServer(port=web_server_port)
         self.api_client = ApiClient(server_url=server_url, client_id=client_id)
-        self.player = Player(fullscreen=True, no_osc=True)
+        player_class = MpvIpcPlayer if persistent_player else Player
+        self.player = player_class(fullscreen=True, no_osc=True)
         self.button_handler = ButtonHandler(callback=self._on_button_press, gpio_pin=gpio_pin)
         self.state_machine = StateMachine(on_state_change=self._on_state_change)
 
         # Thread for monitoring video playback
         self.monitor_thread: Optional[threading.Thread] = None
 
+        # Timers for error recovery and closing HTML pages
+        self._recovery_timer: Optional[threading.Timer] = None
+        self._browser_timer: Optional[threading.Timer] = None
+
         # Browser process for displaying HTML pages
         self.browser_process = None
+        self._browser_path, self._browser_args = self._discover_browser()
 
         logger.info(
             f"ClientApp initialized: server={server_url}, "
@@ -81,12 +99,28 @@ class ClientApp:
 
         logger.info("Starting ClientApp...")
         self.running = True
+        self._shutdown_event.clear()
 
         # Start web server
         self.web_server.start()
 
+        # Warm up the server connection before the first button press
+        self.api_client.check_server_health_async(callback=self._on_health_checked)
+
         logger.info("ClientApp started successfully")
 
+    def _on_health_checked(self, healthy: bool):
+        """
+        Log the result of the startup server health check.
+
+        Args:
+            healthy: Whether the server responded
+        """
+        if healthy:
+            logger.info(f"Server at {self.server_url} is reachable")
+        else:
+            logger.warning(f"Server at {self.server_url} is not reachable yet")
+
     def stop(self):
         """
         Stop the client application.
@@ -100,10 +134,17 @@ class ClientApp:
         logger.info("Stopping ClientApp...")
         self.running = False
 
+        # Cancel pending timers
+        for timer in (self._recovery_timer, self._browser_timer):
+            if timer is not None:
+                timer.cancel()
+
         # Stop all components
         self.player.stop()
+        self.player.close()
         self.web_server.stop()
         self.button_handler.close()
+        self.api_client.close()
 
         # Clean up browser process if running
         if self.browser_process:
@@ -115,6 +156,8 @@ class ClientApp:
                     logger.warning(f"Error terminating browser process: {e}")
             self.browser_process = None
 
+        self._shutdown_event.set()
+
         logger.info("ClientApp stopped successfully")
 
     def _on_button_press(self):
@@ -140,7 +183,6 @@ class ClientApp:
         """
         def fetch_and_play():
             try:
-                # Fetch next video from server
                 logger.info("Fetching next video from server...")
                 video_data = self.api_client.get_next_video()
 
@@ -178,57 +220,60 @@ class ClientApp:
         thread = threading.Thread(target=fetch_and_play, daemon=True)
         thread.start()
 
-    def _display_html_page(self, url: str):
-        """
-        Display an HTML page in a browser (for UI screens like limit reached).
-
-        Args:
-            url: URL of the HTML page to display
+    @staticmethod
+    def _discover_browser() -> Tuple[Optional[str], List[str]]:
         """
-        import subprocess
-        import shutil
-        import webbrowser
-        import platform
-        import os
+        Find a browser suitable for displaying HTML pages in kiosk mode.
 
-        # Try to find a suitable browser
-        # Priority: chromium (Pi) > chrome (Mac/Linux) > default browser
-        browser_path = None
-        browser_args = []
+        Priority: chromium (Pi) > chrome (Mac/Linux) > none (default browser).
 
+        Returns:
+            tuple: (browser_path, browser_args), or (None, []) if no
+            supported browser was found
+        """
         # Check for Chromium (Raspberry Pi)
         chromium = shutil.which('chromium-browser') or shutil.which('chromium')
         if chromium:
-            browser_path = chromium
-            browser_args = [
+            logger.info(f"Found Chromium at: {chromium}")
+            return chromium, [
                 '--kiosk',
                 '--noerrdialogs',
                 '--disable-infobars',
                 '--no-first-run',
             ]
-            logger.info(f"Found Chromium at: {chromium}")
 
         # Check for Chrome (Mac/Linux/Windows)
-        elif shutil.which('google-chrome'):
-            browser_path = shutil.which('google-chrome')
-            browser_args = ['--kiosk']
-            logger.info(f"Found Chrome at: {browser_path}")
+        chrome = shutil.which('google-chrome')
+        if chrome:
+            logger.info(f"Found Chrome at: {chrome}")
+            return chrome, ['--kiosk']
 
         # Check for Chrome on Mac (Application bundle)
-        elif platform.system() == 'Darwin':
+        if platform.system() == 'Darwin':
             chrome_mac = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
             if os.path.exists(chrome_mac):
-                browser_path = chrome_mac
-                browser_args = ['--kiosk']
                 logger.info(f"Found Chrome on Mac at: {chrome_mac}")
+                return chrome_mac, ['--kiosk']
+
+        return None, []
+
+    def _display_html_page(self, url: str):
+        """
+        Display an HTML page in a browser (for UI screens like limit reached).
 
-        if browser_path:
+        Args:
+            url: URL of the HTML page to display
+        """
+        if self._browser_path:
             logger.info(f"Opening HTML page in browser: {url}")
             try:
+                # Output is discarded: a PIPE nobody reads would eventually
+                # fill up and block the browser
                 self.browser_process = subprocess.Popen(
-                    [browser_path] + browser_args + [url],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
+                    [self._browser_path] + self._browser_args + [url],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True
                 )
                 return
             except Exception as e:
@@ -247,34 +292,23 @@ class ClientApp:
 
     def _start_video_monitor(self):
         """
-        Start a thread to monitor video playback and detect completion.
+        Start monitoring playback and detect completion.
+
+        Videos are monitored by a thread waiting on mpv. HTML pages (like
+        limit reached) are closed by a timer after a few seconds.
         """
+        if self.browser_process:
+            logger.info("Monitoring browser process...")
+            self._browser_timer = threading.Timer(5, self._close_html_page)
+            self._browser_timer.daemon = True
+            self._browser_timer.start()
+            return
+
         def monitor():
             logger.info("Starting video monitor...")
 
-            # Check if we're displaying HTML or playing video
-            if hasattr(self, 'browser_process') and self.browser_process:
-                # Monitor browser process
-                logger.info("Monitoring browser process...")
-                # For HTML pages (like limit reached), auto-close after 5 seconds
-                import time
-                time.sleep(5)
-
-                # If browser_process is an actual process, terminate it
-                if hasattr(self.browser_process, 'terminate'):
-                    try:
-                        self.browser_process.terminate()
-                        self.browser_process.wait()
-                    except Exception as e:
-                        logger.warning(f"Error terminating browser: {e}")
-                # Otherwise it's just a flag (webbrowser.open case)
-                # and we can't close it programmatically
-                logger.warning("Browser opened via webbrowser.open(); cannot be closed programmatically. User must close the browser manually.")
-
-                self.browser_process = None
-            else:
-                # Monitor MPV video playback
-                self.player.wait_for_completion()
+            # Monitor MPV video playback
+            self.player.wait_for_completion()
 
             logger.info("Playback completed")
 
@@ -284,6 +318,29 @@ class ClientApp:
         self.monitor_thread = threading.Thread(target=monitor, daemon=True)
         self.monitor_thread.start()
 
+    def _close_html_page(self):
+        """
+        Close the browser showing an HTML page and return to IDLE.
+        """
+        # If browser_process is an actual process, terminate it
+        if hasattr(self.browser_process, 'terminate'):
+            try:
+                self.browser_process.terminate()
+                self.browser_process.wait()
+            except Exception as e:
+                logger.warning(f"Error terminating browser: {e}")
+        else:
+            # Otherwise it's just a flag (webbrowser.open case)
+            # and we can't close it programmatically
+            logger.warning("Browser opened via webbrowser.open(); cannot be closed programmatically. User must close the browser manually.")
+
+        self.browser_process = None
+
+        logger.info("Playback completed")
+
+        # Transition back to IDLE
+        self._on_video_complete()
+
     def _on_video_complete(self):
         """
         Handle video completion.
@@ -315,13 +372,10 @@ class ClientApp:
         Args:
             delay: Delay in seconds before attempting recovery (default: 5)
         """
-        def recovery():
-            logger.info(f"Waiting {delay} seconds before error recovery...")
-            time.sleep(delay)
-            self._recover_from_error()
-
-        thread = threading.Thread(target=recovery, daemon=True)
-        thread.start()
+        logger.info(f"Waiting {delay} seconds before error recovery...")
+        self._recovery_timer = threading.Timer(delay, self._recover_from_error)
+        self._recovery_timer.daemon = True
+        self._recovery_timer.start()
 
     def _recover_from_error(self):
         """
@@ -343,9 +397,8 @@ class ClientApp:
         logger.info("ClientApp running. Press Ctrl+C to stop.")
 
         try:
-            # Keep the main thread alive
-            while self.running:
-                time.sleep(1)
+            # Block the main thread until stop() is called
+            self._shutdown_event.wait()
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt, shutting down...")
         finally:
@@ -358,8 +411,6 @@ def main():
 
     Reads configuration from environment variables and starts the app.
     """
-    import os
-
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
@@ -367,24 +418,16 @@ def main():
     )
 
     # Read configuration from environment
-    server_url = os.getenv("BOBAVISION_SERVER_URL", "http://localhost:8000")
-    client_id = os.getenv("BOBAVISION_CLIENT_ID", "default-client")
-    web_server_port = int(os.getenv("BOBAVISION_WEB_PORT", "5000"))
-    gpio_pin = int(os.getenv("BOBAVISION_GPIO_PIN", "17"))
+    config = ClientConfig.from_env()
 
     logger.info(f"Starting BobaVision Client...")
-    logger.info(f"  Server URL: {server_url}")
-    logger.info(f"  Client ID: {client_id}")
-    logger.info(f"  Web Port: {web_server_port}")
-    logger.info(f"  GPIO Pin: {gpio_pin}")
+    logger.info(f"  Server URL: {config.server_url}")
+    logger.info(f"  Client ID: {config.client_id}")
+    logger.info(f"  Web Port: {config.web_server_port}")
+    logger.info(f"  GPIO Pin: {config.gpio_pin}")
 
     # Create and run the application
-    app = ClientApp(
-        server_url=server_url,
-        client_id=client_id,
-        web_server_port=web_server_port,
-        gpio_pin=gpio_pin
-    )
+    app = ClientApp(**asdict(config))
 
     app.run()
 
@@ -2,33 +2,129 @@
 Video player wrapper for mpv.
 
 This module provides a simple interface to control mpv video playback
-on the Raspberry Pi client.
+on the Raspberry Pi client. Player starts a new mpv process per video;
+MpvIpcPlayer keeps one idle mpv process and loads videos over its IPC
+socket.
 """
+import json
 import logging
+import os
+import select
+import shutil
+import socket
 import subprocess
+import tempfile
+import threading
 import time
-from typing import Optional
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
 
+def _wait_pidfd(pid: int, timeout: float) -> bool:
+    """
+    Wait for a process to exit using a Linux pidfd.
+
+    Wakes up as soon as the process exits instead of polling on a timer.
+
+    Args:
+        pid: Process ID to wait for
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        bool: True if the process exited, False on timeout
+
+    Raises:
+        OSError: If pidfd is not supported (non-Linux or kernel < 5.3)
+    """
+    if not hasattr(os, "pidfd_open"):
+        raise OSError("pidfd_open is not available on this platform")
+
+    pidfd = os.pidfd_open(pid)
+    try:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        return bool(poller.poll(int(timeout * 1000)))
+    finally:
+        os.close(pidfd)
+
+
+def _stop_process(process: subprocess.Popen, timeout: float = 2.0):
+    """
+    Wait for a process to exit, killing it if it takes too long.
+
+    The caller is expected to have asked the process to exit already
+    (e.g., with terminate() or an mpv quit command).
+
+    Args:
+        process: Process to wait for
+        timeout: Seconds to wait before force killing (default: 2.0)
+    """
+    try:
+        _wait_pidfd(process.pid, timeout=timeout)
+    except (AttributeError, OSError, TypeError):
+        # No pidfd support (or no real pid), fall back to polling
+        for _ in range(int(timeout * 10)):
+            if process.poll() is not None:
+                break
+            time.sleep(0.1)
+
+    # If still running, force kill
+    if process.poll() is None:
+        process.kill()
+        process.wait()
+
+
 class Player:
     """Wrapper for mpv video player."""
 
-    def __init__(self, fullscreen: bool = True, no_osc: bool = True):
+    __slots__ = (
+        'fullscreen', 'no_osc', 'hwdec', 'vo', 'cache', '_mpv_prefix',
+        'process', 'is_playing', 'current_url', '_mpv_path', '_stderr_file'
+    )
+
+    # Most of mpv's stderr output to include in a failure log, in bytes
+    STDERR_READ_LIMIT = 16 * 1024
+
+    def __init__(
+        self,
+        fullscreen: bool = True,
+        no_osc: bool = True,
+        hwdec: Optional[str] = "auto-safe",
+        vo: Optional[str] = "gpu,drm",
+        cache: bool = True
+    ):
         """
         Initialize the video player.
 
         Args:
             fullscreen: Whether to play videos in fullscreen mode (default: True)
             no_osc: Whether to disable on-screen controls (default: True)
+            hwdec: mpv hardware decoding mode, None to use mpv's default
+                (default: "auto-safe", which uses the Pi's video decoder)
+            vo: mpv video output list, None to use mpv's default
+                (default: "gpu,drm", DRM as fallback when there is no desktop)
+            cache: Whether to enable mpv's network cache (default: True)
         """
         self.fullscreen = fullscreen
         self.no_osc = no_osc
+        self.hwdec = hwdec
+        self.vo = vo
+        self.cache = cache
+        # Options are fixed at construction, so build the command prefix once
+        self._mpv_prefix = ("mpv", *self._mpv_options())
         self.process: Optional[subprocess.Popen] = None
         self.is_playing = False
         self.current_url: Optional[str] = None
 
+        # Absolute path to mpv, resolved once. An executable with a
+        # directory component is one of the conditions for CPython to
+        # launch it with posix_spawn() instead of fork()+exec().
+        self._mpv_path = shutil.which("mpv") or "mpv"
+
+        # mpv's stderr for the current video, read back when it fails
+        self._stderr_file = None
+
     def play(self, url: str):
         """
         Play a video from the given URL or file path.
@@ -44,43 +140,32 @@ class Player:
             self.stop()
 
         # Build mpv command arguments
-        args = ["mpv"]
-
-        if self.fullscreen:
-            args.append("--fs")
-
-        if self.no_osc:
-            args.append("--no-osc")
-
-        # Disable on-screen display bar
-        args.append("--no-osd-bar")
-
-        # Disable input from terminal
-        args.append("--no-input-terminal")
-
-        # Add the video URL/path
-        args.append(url)
+        args = (*self._mpv_prefix, url)
 
         # Start mpv process with logging
-        logger.info(f"Starting mpv with command: {' '.join(args)}")
+        logger.info("Starting mpv with command: %s", args)
         try:
+            # stderr goes to a temp file rather than a pipe: a pipe nobody
+            # reads during playback can fill up and block mpv
+            self._close_stderr_file()
+            self._stderr_file = tempfile.TemporaryFile()
+
+            # These arguments keep CPython on its posix_spawn() fast path:
+            # absolute executable, close_fds=False (Python's own fds are
+            # non-inheritable anyway), no pass_fds/preexec_fn/cwd/shell,
+            # and no new session
             self.process = subprocess.Popen(
                 args,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                executable=self._mpv_path,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=self._stderr_file,
+                close_fds=False
             )
 
-            # Check if process started successfully
-            time.sleep(0.1)  # Give it a moment to fail if it's going to
-            if self.process.poll() is not None:
-                # Process already exited - capture error output
-                stdout, stderr = self.process.communicate()
-                logger.error(
-                    f"mpv exited immediately with code {self.process.returncode}\n"
-                    f"stdout: {stdout.decode() if stdout else '(empty)'}\n"
-                    f"stderr: {stderr.decode() if stderr else '(empty)'}"
-                )
-                raise RuntimeError(f"mpv failed to start (exit code {self.process.returncode})")
+            # No need to wait and poll here: exec failures (e.g., mpv not
+            # installed) are raised by Popen itself, and playback errors are
+            # logged by wait_for_completion() when mpv exits
 
             self.is_playing = True
             self.current_url = url
@@ -93,6 +178,39 @@ class Player:
             logger.error(f"Failed to start mpv: {e}", exc_info=True)
             raise
 
+    def _mpv_options(self) -> List[str]:
+        """
+        Build the mpv options shared by every launch.
+
+        Returns:
+            list: mpv command line options (without executable or URL)
+        """
+        options = []
+
+        if self.fullscreen:
+            options.append("--fs")
+
+        if self.no_osc:
+            options.append("--no-osc")
+
+        # Disable on-screen display bar
+        options.append("--no-osd-bar")
+
+        # Disable input from terminal
+        options.append("--no-input-terminal")
+
+        # Decode on the GPU/VPU instead of the CPU where possible
+        if self.hwdec:
+            options.append(f"--hwdec={self.hwdec}")
+
+        if self.vo:
+            options.append(f"--vo={self.vo}")
+
+        if self.cache:
+            options.append("--cache=yes")
+
+        return options
+
     def is_running(self) -> bool:
         """
         Check if a video is currently playing.
@@ -118,16 +236,40 @@ class Player:
             self.is_playing = False
 
             if exit_code != 0:
-                # Capture any error output
-                stdout, stderr = self.process.communicate()
+                # Log any error output
                 logger.warning(
                     f"mpv exited with code {exit_code}\n"
-                    f"stdout: {stdout.decode() if stdout else '(empty)'}\n"
-                    f"stderr: {stderr.decode() if stderr else '(empty)'}"
+                    f"stderr: {self._read_stderr()}"
                 )
             else:
                 logger.info(f"Video playback completed successfully (exit code 0)")
 
+    def _read_stderr(self, start: int = 0) -> str:
+        """
+        Read what mpv has written to stderr for the current video.
+
+        Only the last STDERR_READ_LIMIT bytes are read.
+
+        Args:
+            start: Offset in the stderr file where the current video's output begins
+
+        Returns:
+            str: mpv's error output, or "(empty)" if there is none
+        """
+        if self._stderr_file is None:
+            return "(empty)"
+
+        end = self._stderr_file.seek(0, os.SEEK_END)
+        self._stderr_file.seek(max(start, end - self.STDERR_READ_LIMIT))
+        output = self._stderr_file.read().decode(errors="replace")
+        return output or "(empty)"
+
+    def _close_stderr_file(self):
+        """Close and discard the stderr file of the previous video."""
+        if self._stderr_file is not None:
+            self._stderr_file.close()
+            self._stderr_file = None
+
     def get_exit_code(self) -> Optional[int]:
         """
         Get the exit code of the mpv process.
@@ -150,20 +292,318 @@ class Player:
         if self.process is None:
             return
 
-        # Send terminate signal
+        # Send terminate signal and wait up to 2 seconds for graceful shutdown
         self.process.terminate()
+        _stop_process(self.process)
 
-        # Wait up to 2 seconds for graceful shutdown
-        for _ in range(20):
-            if self.process.poll() is not None:
-                break
-            time.sleep(0.1)
+        self.is_playing = False
+        self.process = None
+        self.current_url = None
+        self._close_stderr_file()
+
+    def close(self):
+        """
+        Release player resources.
+
+        Each video has its own mpv process, so this just stops playback.
+        """
+        self.stop()
+
+
+class MpvIpcPlayer(Player):
+    """
+    mpv player that keeps a single idle mpv process running.
+
+    Videos are loaded over mpv's JSON IPC socket instead of starting a
+    new mpv for each one, which skips process launch and mpv's own
+    startup (video output and decoder setup) on every button press.
+    mpv is started on the first play() and restarted if it dies.
+    """
+
+    __slots__ = (
+        'socket_path', '_socket', '_send_lock', '_playback_done', '_end_reason',
+        '_stderr_offset'
+    )
+
+    # Seconds to wait for mpv to create its IPC socket
+    CONNECT_TIMEOUT = 5.0
+
+    def __init__(self, *args, socket_path: Optional[str] = None, **kwargs):
+        """
+        Initialize the video player.
+
+        Accepts the same options as Player.
+
+        Args:
+            socket_path: Path for mpv's IPC socket (default: in the temp directory)
+        """
+        super().__init__(*args, **kwargs)
+        self.socket_path = socket_path or os.path.join(
+            tempfile.gettempdir(), f"bobavision-mpv-{os.getpid()}.sock"
+        )
+        self._socket: Optional[socket.socket] = None
+        self._send_lock = threading.Lock()
+
+        # Set when the current video ends; reason comes from mpv's end-file event
+        self._playback_done = threading.Event()
+        self._playback_done.set()
+        self._end_reason: Optional[str] = None
+
+        # Where the current video's output starts in the long-lived stderr file
+        self._stderr_offset = 0
+
+    def play(self, url: str):
+        """
+        Play a video from the given URL or file path.
+
+        Args:
+            url: HTTP URL or local file path to the video
+
+        Raises:
+            FileNotFoundError: If mpv is not installed
+            RuntimeError: If mpv fails to start
+        """
+        # Stop any existing video first
+        if self.is_running():
+            self.stop()
 
-        # If still running, force kill
-        if self.process.poll() is None:
-            self.process.kill()
-            self.process.wait()
+        try:
+            self._ensure_started()
+        except FileNotFoundError:
+            logger.error("mpv is not installed or not in PATH")
+            raise
+
+        self._end_reason = None
+        self._playback_done.clear()
+
+        logger.info("Loading video in mpv: %s", url)
+        try:
+            self._load(url)
+        except OSError as e:
+            # mpv went away since the last video; restart it once
+            logger.warning(f"Lost connection to mpv ({e}), restarting it")
+            self._shutdown_process()
+            self._ensure_started()
+            self._load(url)
+
+        self.is_playing = True
+        self.current_url = url
+
+    def is_running(self) -> bool:
+        """
+        Check if a video is currently playing.
+
+        Returns:
+            bool: True if video is playing, False otherwise
+        """
+        if self.process is None or self.process.poll() is not None:
+            return False
+
+        return not self._playback_done.is_set()
+
+    def wait_for_completion(self):
+        """
+        Block until the current video finishes playing.
+        """
+        if self.process is None:
+            return
+
+        self._playback_done.wait()
+        self.is_playing = False
+
+        if self._end_reason == "error":
+            logger.warning(
+                f"mpv failed to play {self.current_url}\n"
+                f"stderr: {self._read_stderr(self._stderr_offset)}"
+            )
+        else:
+            logger.info("Video playback completed successfully")
+
+    def get_exit_code(self) -> Optional[int]:
+        """
+        Get the result of the current video.
+
+        Returns:
+            int or None: 1 if playback failed, 0 if it ended normally,
+            None if still playing or nothing was played
+        """
+        if self.process is None or not self._playback_done.is_set():
+            return None
+
+        return 1 if self._end_reason == "error" else 0
+
+    def stop(self):
+        """
+        Stop the currently playing video.
+
+        mpv itself keeps running (idle) for the next video.
+        """
+        if self.process is not None and not self._playback_done.is_set():
+            try:
+                self._send(["stop"])
+            except OSError:
+                pass
+
+            if not self._playback_done.wait(timeout=2.0):
+                logger.warning("mpv did not confirm stop, restarting it")
+                self._shutdown_process()
 
         self.is_playing = False
-        self.process = None
         self.current_url = None
+
+    def close(self):
+        """
+        Stop playback and shut down the mpv process.
+        """
+        self.stop()
+        self._shutdown_process()
+
+    def _ensure_started(self):
+        """Start mpv in idle mode and connect to its IPC socket if needed."""
+        if self._socket is not None and self.process is not None and self.process.poll() is None:
+            return
+
+        self._shutdown_process()
+
+        # Remove a stale socket left behind by a previous run
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+        args = (
+            *self._mpv_prefix,
+            "--idle=yes",
+            f"--input-ipc-server={self.socket_path}"
+        )
+
+        logger.info("Starting idle mpv with command: %s", args)
+        self._stderr_file = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            args,
+            executable=self._mpv_path,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=self._stderr_file,
+            close_fds=False
+        )
+
+        self._socket = self._connect()
+        reader = threading.Thread(
+            target=self._read_events,
+            args=(self._socket,),
+            daemon=True
+        )
+        reader.start()
+
+    def _connect(self) -> socket.socket:
+        """
+        Connect to mpv's IPC socket, waiting for mpv to create it.
+
+        Returns:
+            socket.socket: Connected socket
+
+        Raises:
+            RuntimeError: If mpv exits or the socket doesn't appear in time
+        """
+        deadline = time.monotonic() + self.CONNECT_TIMEOUT
+
+        while True:
+            if self.process.poll() is not None:
+                raise RuntimeError(
+                    f"mpv failed to start (exit code {self.process.returncode}): "
+                    f"{self._read_stderr()}"
+                )
+
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.socket_path)
+                return sock
+            except OSError:
+                sock.close()
+                if time.monotonic() >= deadline:
+                    raise RuntimeError("Timed out waiting for mpv IPC socket")
+                time.sleep(0.05)
+
+    def _load(self, url: str):
+        """
+        Tell mpv to play a video, noting where its stderr output begins.
+
+        Args:
+            url: HTTP URL or local file path to the video
+
+        Raises:
+            OSError: If mpv is not connected
+        """
+        self._stderr_offset = self._stderr_file.seek(0, os.SEEK_END)
+        self._send(["loadfile", url, "replace"])
+
+    def _send(self, command: List[str]):
+        """
+        Send a command to mpv.
+
+        Args:
+            command: mpv command and arguments (e.g., ["loadfile", url])
+
+        Raises:
+            OSError: If mpv is not connected
+        """
+        message = json.dumps({"command": command}).encode() + b"\n"
+
+        with self._send_lock:
+            if self._socket is None:
+                raise OSError("mpv is not connected")
+            self._socket.sendall(message)
+
+    def _read_events(self, sock: socket.socket):
+        """
+        Read events from mpv and track when videos end.
+
+        Args:
+            sock: Socket connected to mpv
+        """
+        try:
+            with sock.makefile("rb") as stream:
+                for line in stream:
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        continue
+
+                    if message.get("event") == "end-file":
+                        self._on_end_file(message.get("reason"))
+        except (OSError, ValueError):
+            # Socket closed by _shutdown_process()
+            pass
+
+        # mpv went away while a video was playing
+        if sock is self._socket and not self._playback_done.is_set():
+            self._on_end_file("error")
+
+    def _on_end_file(self, reason: Optional[str]):
+        """
+        Record that the current video has ended.
+
+        Args:
+            reason: mpv's end-file reason (e.g., "eof", "stop", "error")
+        """
+        self._end_reason = reason
+        self.is_playing = False
+        self._playback_done.set()
+
+    def _shutdown_process(self):
+        """Quit mpv, close the IPC socket and clean up."""
+        sock, self._socket = self._socket, None
+        if sock is not None:
+            try:
+                sock.sendall(json.dumps({"command": ["quit"]}).encode() + b"\n")
+            except OSError:
+                pass
+            sock.close()
+
+        if self.process is not None:
+            _stop_process(self.process)
+            self.process = None
+
+        self._close_stderr_file()
+        self._playback_done.set()
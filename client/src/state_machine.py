@@ -33,6 +33,15 @@ class StateMachine:
     - ERROR → IDLE: Error recovered
     """
 
+    __slots__ = ('current_state', 'previous_state', 'on_state_change')
+
+    # Transition tables: current state → next state for each event.
+    # Events in states not listed are ignored.
+    _BUTTON_PRESS_TRANSITIONS = {State.IDLE: State.LOADING}
+    _VIDEO_READY_TRANSITIONS = {State.LOADING: State.PLAYING}
+    _VIDEO_END_TRANSITIONS = {State.PLAYING: State.IDLE}
+    _ERROR_RECOVERY_TRANSITIONS = {State.ERROR: State.IDLE}
+
     def __init__(self, on_state_change: Optional[Callable[[State, State], None]] = None):
         """
         Initialize the state machine.
@@ -78,23 +87,14 @@ class StateMachine:
         Returns:
             The new state after handling the event
         """
-        if self.current_state == State.IDLE:
-            # Start loading video
-            return self._transition(State.LOADING)
-        elif self.current_state == State.LOADING:
-            # Ignore button press while loading
-            logger.debug("Button press ignored (currently loading)")
-            return self.current_state
-        elif self.current_state == State.PLAYING:
-            # Ignore button press during playback
-            logger.debug("Button press ignored (currently playing)")
-            return self.current_state
-        elif self.current_state == State.ERROR:
-            # Ignore button press during error state
-            logger.debug("Button press ignored (in error state)")
-            return self.current_state
+        current_state = self.current_state
+        next_state = self._BUTTON_PRESS_TRANSITIONS.get(current_state)
+        if next_state is None:
+            # Ignore button press while loading, playing or in error state
+            logger.debug(f"Button press ignored (current state: {current_state.name})")
+            return current_state
 
-        return self.current_state
+        return self._transition(next_state)
 
     def on_video_ready(self) -> State:
         """
@@ -103,11 +103,13 @@ class StateMachine:
         Returns:
             The new state after handling the event
         """
-        if self.current_state == State.LOADING:
-            return self._transition(State.PLAYING)
+        current_state = self.current_state
+        next_state = self._VIDEO_READY_TRANSITIONS.get(current_state)
+        if next_state is None:
+            logger.warning(f"Video ready event ignored (current state: {current_state.name})")
+            return current_state
 
-        logger.warning(f"Video ready event ignored (current state: {self.current_state.name})")
-        return self.current_state
+        return self._transition(next_state)
 
     def on_video_end(self) -> State:
         """
@@ -116,11 +118,13 @@ class StateMachine:
         Returns:
             The new state after handling the event
         """
-        if self.current_state == State.PLAYING:
-            return self._transition(State.IDLE)
+        current_state = self.current_state
+        next_state = self._VIDEO_END_TRANSITIONS.get(current_state)
+        if next_state is None:
+            logger.warning(f"Video end event ignored (current state: {current_state.name})")
+            return current_state
 
-        logger.warning(f"Video end event ignored (current state: {self.current_state.name})")
-        return self.current_state
+        return self._transition(next_state)
 
     def on_error(self, error_message: str) -> State:
         """
@@ -142,11 +146,13 @@ class StateMachine:
         Returns:
             The new state after handling the event
         """
-        if self.current_state == State.ERROR:
-            logger.info("Recovering from error state")
-            return self._transition(State.IDLE)
+        current_state = self.current_state
+        next_state = self._ERROR_RECOVERY_TRANSITIONS.get(current_state)
+        if next_state is None:
+            return current_state
 
-        return self.current_state
+        logger.info("Recovering from error state")
+        return self._transition(next_state)
 
     def reset(self):
         """
@@ -5,9 +5,15 @@ This module provides a Flask-based HTTP server that serves the kid-friendly
 UI screens (splash, loading, error, all done) along with static assets.
 """
 import os
-import threading
 from pathlib import Path
+from threading import Thread
 from flask import Flask, send_from_directory, send_file
+from werkzeug.serving import make_server
+
+# How long the browser may reuse CSS/JS/asset files without asking again.
+# File names aren't content-hashed, so this stays short enough for UI
+# updates to show up; after it expires, ETags turn refetches into 304s.
+STATIC_MAX_AGE = 24 * 60 * 60
 
 
 class WebServer:
@@ -23,6 +29,7 @@ class WebServer:
         self.port = port
         self.running = False
         self.thread = None
+        self.server = None
 
         # Get path to UI directory
         client_dir = Path(__file__).parent.parent
@@ -34,68 +41,80 @@ class WebServer:
 
     def _setup_routes(self):
         """Set up Flask routes for serving UI files."""
+        # Resolve the paths once instead of joining Path objects per request
+        ui_dir = str(self.ui_dir)
+        splash_path = str(self.ui_dir / 'splash.html')
+        styles_dir = str(self.ui_dir / 'styles')
+        scripts_dir = str(self.ui_dir / 'scripts')
+        assets_dir = str(self.ui_dir / 'assets')
 
         @self.app.route('/')
         def splash():
             """Serve splash screen at root."""
-            return send_file(self.ui_dir / 'splash.html')
+            return send_file(splash_path)
 
+        # HTML entry points get no max_age, so Flask marks them no-cache:
+        # the browser revalidates each load and gets a 304 via the ETag
         @self.app.route('/<path:filename>')
         def serve_file(filename):
             """Serve static files from UI directory."""
-            return send_from_directory(self.ui_dir, filename)
+            return send_from_directory(ui_dir, filename)
 
         @self.app.route('/styles/<path:filename>')
         def serve_styles(filename):
             """Serve CSS files from styles directory."""
-            return send_from_directory(self.ui_dir / 'styles', filename)
+            return send_from_directory(styles_dir, filename, max_age=STATIC_MAX_AGE)
 
         @self.app.route('/scripts/<path:filename>')
         def serve_scripts(filename):
             """Serve JavaScript files from scripts directory."""
-            return send_from_directory(self.ui_dir / 'scripts', filename)
+            return send_from_directory(scripts_dir, filename, max_age=STATIC_MAX_AGE)
 
         @self.app.route('/assets/<path:filename>')
         def serve_assets(filename):
             """Serve asset files (images, fonts, etc.) from assets directory."""
-            return send_from_directory(self.ui_dir / 'assets', filename)
+            return send_from_directory(assets_dir, filename, max_age=STATIC_MAX_AGE)
 
     def start(self):
         """
         Start the web server in a background thread.
 
-        The server runs in daemon mode so it will automatically
-        shut down when the main program exits.
+        The server handles each request in its own thread, so the browser
+        can fetch HTML, CSS and JS in parallel. Serving files is I/O bound
+        and file reads release the GIL, so one process is enough. It runs
+        in daemon mode so it will automatically shut down when the main
+        program exits.
         """
         if self.running:
             return
 
+        # Bind here rather than in the thread so port errors surface to the caller
+        self.server = make_server('0.0.0.0', self.port, self.app, threaded=True)
+
         self.running = True
-        self.thread = threading.Thread(
+        self.thread = Thread(
             target=self._run_server,
             daemon=True
         )
         self.thread.start()
 
     def _run_server(self):
-        """Internal method to run Flask server."""
-        self.app.run(
-            host='0.0.0.0',
-            port=self.port,
-            debug=False,
-            use_reloader=False
-        )
+        """Internal method to serve requests until stop() is called."""
+        self.server.serve_forever()
 
     def stop(self):
         """
         Stop the web server gracefully.
 
-        Note: Flask's built-in server doesn't have a clean shutdown
-        mechanism, so we just mark it as not running. In production,
-        consider using a WSGI server like Gunicorn.
+        Waits for the serving loop to exit and releases the port.
         """
         self.running = False
 
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
     def get_url(self):
         """
         Get the base URL of the web server.
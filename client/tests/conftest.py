@@ -1,6 +1,19 @@
 """Shared test fixtures for client tests."""
+import os
+import socket
+import subprocess
+import time
+
 import pytest
 from unittest.mock import Mock, patch
+from src.web_server import WebServer
+
+# Playwright tests need a browser and display environment, so they only run
+# with ENABLE_PLAYWRIGHT_TESTS=1. Otherwise the module is never collected,
+# which also avoids importing playwright at all.
+collect_ignore = []
+if os.getenv("ENABLE_PLAYWRIGHT_TESTS") != "1":
+    collect_ignore.append("test_ui_screens.py")
 
 
 @pytest.fixture
@@ -28,14 +41,55 @@ def mock_http_client():
 def mock_subprocess():
     """Mock subprocess for testing mpv without actual process."""
     with patch('subprocess.Popen') as mock_popen:
-        mock_process = Mock()
+        mock_process = Mock(spec=subprocess.Popen)
         mock_process.poll.return_value = None  # Process is running
         mock_popen.return_value = mock_process
         yield mock_popen
 
 
+@pytest.fixture(scope="session")
+def web_server():
+    """Start the UI web server once for every test module that needs it."""
+    server = WebServer(port=5001)
+    server.start()
+    try:
+        # Return as soon as the port accepts connections
+        for _ in range(200):
+            with socket.socket() as probe:
+                if probe.connect_ex(("127.0.0.1", server.port)) == 0:
+                    break
+            time.sleep(0.005)
+        yield server
+    finally:
+        server.stop()
+
+
 # Playwright configuration for headless testing
 
+@pytest.fixture(scope="session")
+def shared_context(browser, browser_context_args):
+    """Browser context created once and shared by every UI test."""
+    context = browser.new_context(**browser_context_args)
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def page(shared_context):
+    """
+    Fresh Playwright page in the shared browser context.
+
+    Only the page is created per test; cookies are cleared afterwards so
+    tests stay independent. The page gives up after 5 seconds instead of
+    30, so a broken screen fails fast rather than stalling the suite.
+    """
+    page = shared_context.new_page()
+    page.set_default_timeout(5000)
+    yield page
+    page.close()
+    shared_context.clear_cookies()
+
+
 @pytest.fixture(scope="session")
 def browser_context_args(browser_context_args):
     """
@@ -0,0 +1,84 @@
+"""Tests for client configuration."""
+import dataclasses
+
+import pytest
+from src.config import ClientConfig
+
+
+class TestClientConfigFromEnv:
+    """Test building configuration from environment variables."""
+
+    def test_from_env_uses_defaults(self, monkeypatch):
+        """Test that defaults are used when no variables are set."""
+        # Arrange
+        for name in ("BOBAVISION_SERVER_URL", "BOBAVISION_CLIENT_ID",
+                     "BOBAVISION_WEB_PORT", "BOBAVISION_GPIO_PIN",
+                     "BOBAVISION_PERSISTENT_PLAYER"):
+            monkeypatch.delenv(name, raising=False)
+
+        # Act
+        config = ClientConfig.from_env()
+
+        # Assert
+        assert config.server_url == "http://localhost:8000"
+        assert config.client_id == "default-client"
+        assert config.web_server_port == 5000
+        assert config.gpio_pin == 17
+        assert config.persistent_player is False
+
+    def test_from_env_reads_and_parses_variables(self, monkeypatch):
+        """Test that variables are read and numeric values parsed."""
+        # Arrange
+        monkeypatch.setenv("BOBAVISION_SERVER_URL", "http://server:9000")
+        monkeypatch.setenv("BOBAVISION_CLIENT_ID", "living-room")
+        monkeypatch.setenv("BOBAVISION_WEB_PORT", "5555")
+        monkeypatch.setenv("BOBAVISION_GPIO_PIN", "27")
+        monkeypatch.setenv("BOBAVISION_PERSISTENT_PLAYER", "1")
+
+        # Act
+        config = ClientConfig.from_env()
+
+        # Assert
+        assert config.server_url == "http://server:9000"
+        assert config.client_id == "living-room"
+        assert config.web_server_port == 5555
+        assert config.gpio_pin == 27
+        assert config.persistent_player is True
+
+    def test_from_env_uses_custom_default_client_id(self, monkeypatch):
+        """Test that callers can override the default client ID."""
+        # Arrange
+        monkeypatch.delenv("BOBAVISION_CLIENT_ID", raising=False)
+
+        # Act
+        config = ClientConfig.from_env(default_client_id="local-test-client")
+
+        # Assert
+        assert config.client_id == "local-test-client"
+
+    def test_from_env_rejects_non_integer_port(self, monkeypatch):
+        """Test that an invalid port raises ValueError."""
+        # Arrange
+        monkeypatch.setenv("BOBAVISION_WEB_PORT", "not-a-port")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            ClientConfig.from_env()
+
+
+class TestClientConfigImmutability:
+    """Test that configuration cannot be changed after creation."""
+
+    def test_config_is_frozen(self):
+        """Test that assigning to a field raises an error."""
+        # Arrange
+        config = ClientConfig(
+            server_url="http://localhost:8000",
+            client_id="test-client",
+            web_server_port=5000,
+            gpio_pin=17
+        )
+
+        # Act & Assert
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.gpio_pin = 18
@@ -1,4 +1,5 @@
 """Tests for HTTP client that communicates with the media server."""
+import httpx
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from src.http_client import ApiClient
@@ -34,10 +35,11 @@ class TestApiClientInitialization:
 class TestGetNextVideo:
     """Test getting next video from server."""
 
-    @patch('httpx.get')
-    def test_get_next_video_makes_correct_api_call(self, mock_get):
+    @patch('httpx.Client')
+    def test_get_next_video_makes_correct_api_call(self, mock_client_class):
         """Test that get_next_video makes correct HTTP request."""
         # Arrange
+        mock_get = mock_client_class.return_value.get
         mock_response = Mock()
         mock_response.json.return_value = {
             "url": "/media/library/test.mp4",
@@ -57,17 +59,18 @@ class TestGetNextVideo:
 
         # Assert
         mock_get.assert_called_once_with(
-            "http://localhost:8000/api/next?client_id=test_client",
-            timeout=10
+            "/api/next",
+            params={"client_id": "test_client"}
         )
         assert result["url"] == "/media/library/test.mp4"
         assert result["title"] == "Test Video"
         assert result["placeholder"] is False
 
-    @patch('httpx.get')
-    def test_get_next_video_returns_full_url(self, mock_get):
+    @patch('httpx.Client')
+    def test_get_next_video_returns_full_url(self, mock_client_class):
         """Test that get_next_video returns full URL."""
         # Arrange
+        mock_get = mock_client_class.return_value.get
         mock_response = Mock()
         mock_response.json.return_value = {
             "url": "/media/library/test.mp4",
@@ -88,10 +91,11 @@ class TestGetNextVideo:
         # Assert
         assert result["full_url"] == "http://localhost:8000/media/library/test.mp4"
 
-    @patch('httpx.get')
-    def test_get_next_video_handles_placeholder_flag(self, mock_get):
+    @patch('httpx.Client')
+    def test_get_next_video_handles_placeholder_flag(self, mock_client_class):
         """Test that placeholder flag is correctly handled."""
         # Arrange
+        mock_get = mock_client_class.return_value.get
         mock_response = Mock()
         mock_response.json.return_value = {
             "url": "/media/library/placeholder.mp4",
@@ -116,10 +120,11 @@ class TestGetNextVideo:
 class TestErrorHandling:
     """Test error handling in API client."""
 
-    @patch('httpx.get')
-    def test_get_next_video_handles_connection_error(self, mock_get):
+    @patch('httpx.Client')
+    def test_get_next_video_handles_connection_error(self, mock_client_class):
         """Test graceful handling of connection errors."""
         # Arrange
+        mock_get = mock_client_class.return_value.get
         mock_get.side_effect = Exception("Connection refused")
         client = ApiClient(
             server_url="http://localhost:8000",
@@ -131,10 +136,11 @@ class TestErrorHandling:
             client.get_next_video()
         assert "Connection refused" in str(exc_info.value)
 
-    @patch('httpx.get')
-    def test_get_next_video_handles_http_error(self, mock_get):
+    @patch('httpx.Client')
+    def test_get_next_video_handles_http_error(self, mock_client_class):
         """Test handling of HTTP errors (404, 500, etc.)."""
         # Arrange
+        mock_get = mock_client_class.return_value.get
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = Exception("404 Not Found")
         mock_get.return_value = mock_response
@@ -148,11 +154,11 @@ class TestErrorHandling:
         with pytest.raises(Exception):
             client.get_next_video()
 
-    @patch('httpx.get')
-    def test_get_next_video_handles_timeout(self, mock_get):
+    @patch('httpx.Client')
+    def test_get_next_video_handles_timeout(self, mock_client_class):
         """Test handling of request timeout."""
         # Arrange
-        import httpx
+        mock_get = mock_client_class.return_value.get
         mock_get.side_effect = httpx.TimeoutException("Request timeout")
         client = ApiClient(
             server_url="http://localhost:8000",
@@ -163,10 +169,11 @@ class TestErrorHandling:
         with pytest.raises(Exception):
             client.get_next_video()
 
-    @patch('httpx.get')
-    def test_get_next_video_handles_invalid_json(self, mock_get):
+    @patch('httpx.Client')
+    def test_get_next_video_handles_invalid_json(self, mock_client_class):
         """Test handling of invalid JSON response."""
         # Arrange
+        mock_get = mock_client_class.return_value.get
         mock_response = Mock()
         mock_response.raise_for_status = Mock()
         mock_response.json.side_effect = ValueError("Invalid JSON")
@@ -185,10 +192,11 @@ class TestErrorHandling:
 class TestNetworkResilience:
     """Test network resilience features."""
 
-    @patch('httpx.get')
-    def test_get_next_video_with_custom_timeout(self, mock_get):
+    @patch('httpx.Client')
+    def test_get_next_video_with_custom_timeout(self, mock_client_class):
         """Test that custom timeout can be specified."""
         # Arrange
+        mock_get = mock_client_class.return_value.get
         mock_response = Mock()
         mock_response.json.return_value = {
             "url": "/media/library/test.mp4",
@@ -208,7 +216,115 @@ class TestNetworkResilience:
         result = client.get_next_video()
 
         # Assert
+        assert mock_client_class.call_args[1]["timeout"] == 30
         mock_get.assert_called_once_with(
-            "http://localhost:8000/api/next?client_id=test_client",
-            timeout=30
+            "/api/next",
+            params={"client_id": "test_client"}
         )
+
+
+class TestConnectionPooling:
+    """Test persistent HTTP connection handling."""
+
+    @patch('httpx.Client')
+    def test_requests_reuse_single_connection_pool(self, mock_client_class):
+        """Test that repeated requests share one httpx.Client."""
+        # Arrange
+        mock_get = mock_client_class.return_value.get
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "url": "/media/library/test.mp4",
+            "title": "Test Video",
+            "placeholder": False
+        }
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        client = ApiClient(
+            server_url="http://localhost:8000",
+            client_id="test_client"
+        )
+
+        # Act
+        client.get_next_video()
+        client.get_next_video()
+
+        # Assert
+        mock_client_class.assert_called_once()
+        assert mock_get.call_count == 2
+
+    @patch('httpx.Client')
+    def test_close_closes_connection_pool(self, mock_client_class):
+        """Test that close() releases the underlying httpx.Client."""
+        # Arrange
+        client = ApiClient(
+            server_url="http://localhost:8000",
+            client_id="test_client"
+        )
+
+        # Act
+        client.close()
+
+        # Assert
+        mock_client_class.return_value.close.assert_called_once()
+
+
+class TestServerHealth:
+    """Test server health checks."""
+
+    @patch('httpx.Client')
+    def test_check_server_health_caches_healthy_result(self, mock_client_class):
+        """Test that a healthy result is reused within the TTL."""
+        # Arrange
+        mock_get = mock_client_class.return_value.get
+        mock_get.return_value = Mock(status_code=200)
+        client = ApiClient(
+            server_url="http://localhost:8000",
+            client_id="test_client"
+        )
+
+        # Act
+        first = client.check_server_health()
+        second = client.check_server_health()
+
+        # Assert
+        assert first is True
+        assert second is True
+        mock_get.assert_called_once_with("/", timeout=5)
+
+    @patch('httpx.Client')
+    def test_check_server_health_does_not_cache_failure(self, mock_client_class):
+        """Test that an unhealthy result is re-probed on the next check."""
+        # Arrange
+        mock_get = mock_client_class.return_value.get
+        mock_get.side_effect = Exception("Connection refused")
+        client = ApiClient(
+            server_url="http://localhost:8000",
+            client_id="test_client"
+        )
+
+        # Act
+        client.check_server_health()
+        result = client.check_server_health()
+
+        # Assert
+        assert result is False
+        assert mock_get.call_count == 2
+
+    @patch('httpx.Client')
+    def test_check_server_health_async_reports_result(self, mock_client_class):
+        """Test that the async health check passes its result to the callback."""
+        # Arrange
+        mock_client_class.return_value.get.return_value = Mock(status_code=200)
+        callback = Mock()
+        client = ApiClient(
+            server_url="http://localhost:8000",
+            client_id="test_client"
+        )
+
+        # Act
+        thread = client.check_server_health_async(callback=callback)
+        thread.join(timeout=1)
+
+        # Assert
+        callback.assert_called_once_with(True)
@@ -1,8 +1,25 @@
 """Tests for main client application."""
+import threading
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import DEFAULT, Mock, patch, MagicMock, call
 from src.main import ClientApp
 from src.state_machine import State
+from src.web_server import WebServer
+
+
+@pytest.fixture
+def mock_deps():
+    """Patch every ClientApp collaborator in src.main with a single patch.multiple."""
+    with patch.multiple(
+        'src.main',
+        WebServer=Mock(return_value=Mock(spec=WebServer)),
+        ApiClient=DEFAULT,
+        Player=DEFAULT,
+        ButtonHandler=DEFAULT,
+        StateMachine=DEFAULT
+    ) as mocks:
+        yield mocks
 
 
 class TestClientAppInitialization:
@@ -48,18 +65,11 @@ class TestClientAppInitialization:
             mock_web_server.assert_called_once_with(port=5555)
 
 
+@pytest.mark.usefixtures("mock_deps")
 class TestClientAppLifecycle:
     """Test client application lifecycle."""
 
-    @patch('src.main.StateMachine')
-    @patch('src.main.ButtonHandler')
-    @patch('src.main.Player')
-    @patch('src.main.ApiClient')
-    @patch('src.main.WebServer')
-    def test_start_initializes_all_components(
-        self, mock_web_server, mock_api_client, mock_player,
-        mock_button_handler, mock_state_machine
-    ):
+    def test_start_initializes_all_components(self):
         """Test that start() initializes all components."""
         # Arrange
         app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
@@ -70,15 +80,7 @@ class TestClientAppLifecycle:
         # Assert
         app.web_server.start.assert_called_once()
 
-    @patch('src.main.StateMachine')
-    @patch('src.main.ButtonHandler')
-    @patch('src.main.Player')
-    @patch('src.main.ApiClient')
-    @patch('src.main.WebServer')
-    def test_stop_shuts_down_all_components(
-        self, mock_web_server, mock_api_client, mock_player,
-        mock_button_handler, mock_state_machine
-    ):
+    def test_stop_shuts_down_all_components(self):
         """Test that stop() shuts down all components."""
         # Arrange
         app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
@@ -91,20 +93,31 @@ class TestClientAppLifecycle:
         app.web_server.stop.assert_called_once()
         app.player.stop.assert_called_once()
         app.button_handler.close.assert_called_once()
+        app.api_client.close.assert_called_once()
 
+    def test_run_returns_when_stopped(self):
+        """Test that run() unblocks as soon as stop() is called."""
+        # Arrange
+        app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
+        started = threading.Event()
+        app.web_server.start.side_effect = started.set
+        run_thread = threading.Thread(target=app.run, daemon=True)
+        run_thread.start()
+        assert started.wait(timeout=1)
 
+        # Act
+        app.stop()
+        run_thread.join(timeout=1)
+
+        # Assert
+        assert not run_thread.is_alive()
+
+
+@pytest.mark.usefixtures("mock_deps")
 class TestButtonPressFlow:
     """Test the flow when button is pressed."""
 
-    @patch('src.main.StateMachine')
-    @patch('src.main.ButtonHandler')
-    @patch('src.main.Player')
-    @patch('src.main.ApiClient')
-    @patch('src.main.WebServer')
-    def test_button_press_in_idle_state_fetches_video(
-        self, mock_web_server, mock_api_client, mock_player,
-        mock_button_handler, mock_state_machine
-    ):
+    def test_button_press_in_idle_state_fetches_video(self):
         """Test that button press in IDLE state fetches next video."""
         # Arrange
         app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
@@ -123,15 +136,7 @@ class TestButtonPressFlow:
         app.state_machine.on_button_press.assert_called_once()
         app.api_client.get_next_video.assert_called_once()
 
-    @patch('src.main.StateMachine')
-    @patch('src.main.ButtonHandler')
-    @patch('src.main.Player')
-    @patch('src.main.ApiClient')
-    @patch('src.main.WebServer')
-    def test_button_press_starts_video_playback(
-        self, mock_web_server, mock_api_client, mock_player,
-        mock_button_handler, mock_state_machine
-    ):
+    def test_button_press_starts_video_playback(self):
         """Test that video playback starts after fetching."""
         # Arrange
         app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
@@ -150,47 +155,30 @@ class TestButtonPressFlow:
         app.player.play.assert_called_once_with("http://localhost:8000/media/test.mp4")
         app.state_machine.on_video_ready.assert_called_once()
 
-    @patch('src.main.StateMachine')
-    @patch('src.main.ButtonHandler')
-    @patch('src.main.Player')
-    @patch('src.main.ApiClient')
-    @patch('src.main.WebServer')
-    def test_button_press_handles_api_error(
-        self, mock_web_server, mock_api_client, mock_player,
-        mock_button_handler, mock_state_machine
-    ):
+    def test_button_press_handles_api_error(self):
         """Test that API errors transition to ERROR state."""
-        import time
-
         # Arrange
         app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
         app.state_machine.current_state = State.IDLE
         app.state_machine.on_button_press.return_value = State.LOADING
         app.api_client.get_next_video.side_effect = Exception("Network error")
+        error_reported = threading.Event()
+        app.state_machine.on_error.side_effect = lambda message: error_reported.set()
 
         # Act
         app._on_button_press()
 
-        # Wait for background thread to execute
-        time.sleep(0.1)
-
-        # Assert
+        # Assert (the fetch runs on a background thread)
+        assert error_reported.wait(timeout=1.0)
         app.state_machine.on_error.assert_called_once()
         app.player.play.assert_not_called()
 
 
+@pytest.mark.usefixtures("mock_deps")
 class TestVideoCompletion:
     """Test handling of video completion."""
 
-    @patch('src.main.StateMachine')
-    @patch('src.main.ButtonHandler')
-    @patch('src.main.Player')
-    @patch('src.main.ApiClient')
-    @patch('src.main.WebServer')
-    def test_video_completion_transitions_to_idle(
-        self, mock_web_server, mock_api_client, mock_player,
-        mock_button_handler, mock_state_machine
-    ):
+    def test_video_completion_transitions_to_idle(self):
         """Test that video completion transitions back to IDLE."""
         # Arrange
         app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
@@ -202,19 +190,28 @@ class TestVideoCompletion:
         # Assert
         app.state_machine.on_video_end.assert_called_once()
 
+    def test_video_completion_does_not_fetch_next_video(self):
+        """Test that finishing a video doesn't ask the server for the next one.
+
+        /api/next logs a play and pops the queue, so it must only be called
+        when the button is actually pressed.
+        """
+        # Arrange
+        app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
+        app.start()
+
+        # Act
+        app._on_video_complete()
+
+        # Assert
+        app.api_client.get_next_video.assert_not_called()
+
 
+@pytest.mark.usefixtures("mock_deps")
 class TestErrorRecovery:
     """Test error recovery mechanism."""
 
-    @patch('src.main.StateMachine')
-    @patch('src.main.ButtonHandler')
-    @patch('src.main.Player')
-    @patch('src.main.ApiClient')
-    @patch('src.main.WebServer')
-    def test_error_state_auto_recovers_after_timeout(
-        self, mock_web_server, mock_api_client, mock_player,
-        mock_button_handler, mock_state_machine
-    ):
+    def test_error_state_auto_recovers_after_timeout(self):
         """Test that error state recovers to IDLE after timeout."""
         # Arrange
         app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
@@ -225,3 +222,55 @@ class TestErrorRecovery:
 
         # Assert
         app.state_machine.on_error_recovery.assert_called_once()
+
+    def test_error_recovery_fires_after_delay(self):
+        """Test that scheduled recovery runs once the delay has passed."""
+        # Arrange
+        app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
+
+        # Act
+        app._schedule_error_recovery(delay=0)
+        app._recovery_timer.join(timeout=1)
+
+        # Assert
+        app.state_machine.on_error_recovery.assert_called_once()
+
+    def test_stop_cancels_pending_error_recovery(self):
+        """Test that stop() cancels a recovery that hasn't fired yet."""
+        # Arrange
+        app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
+        app.start()
+        app._schedule_error_recovery(delay=60)
+
+        # Act
+        app.stop()
+        app._recovery_timer.join(timeout=1)
+
+        # Assert
+        assert not app._recovery_timer.is_alive()
+        app.state_machine.on_error_recovery.assert_not_called()
+
+
+@pytest.mark.usefixtures("mock_deps")
+class TestHtmlPageDisplay:
+    """Test displaying HTML pages in a browser."""
+
+    @patch('subprocess.Popen')
+    @patch('shutil.which', return_value='/usr/bin/chromium')
+    def test_browser_is_discovered_once(self, mock_which, mock_popen):
+        """Test that browser lookup happens at init, not on every page."""
+        # Arrange
+        app = ClientApp(server_url="http://localhost:8000", client_id="test-client")
+        lookups_at_init = mock_which.call_count
+
+        # Act
+        app._display_html_page("http://localhost:8000/static/limit_reached.html")
+        app._display_html_page("http://localhost:8000/static/limit_reached.html")
+
+        # Assert
+        assert mock_which.call_count == lookups_at_init
+        assert mock_popen.call_count == 2
+        args = mock_popen.call_args[0][0]
+        assert args[0] == '/usr/bin/chromium'
+        assert '--kiosk' in args
+        assert args[-1] == "http://localhost:8000/static/limit_reached.html"
@@ -1,7 +1,61 @@
 """Tests for mpv video player wrapper."""
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from src.player import Player
+from unittest.mock import MagicMock
+from src.player import MpvIpcPlayer, Player
+
+
+# The real class, kept for mock specs while tests patch subprocess.Popen
+_POPEN = subprocess.Popen
+
+
+def _popen_mock(poll=None, rc=None):
+    """
+    Build a mock mpv process.
+
+    Args:
+        poll: Value poll() returns (None means still running)
+        rc: Value of returncode
+
+    Returns:
+        MagicMock: Popen-specced mock that exits when terminated, like mpv
+    """
+    process = MagicMock(spec=_POPEN)
+    process.poll.return_value = poll
+    process.returncode = rc
+
+    def exit_on_terminate():
+        process.poll.return_value = 0
+
+    process.terminate.side_effect = exit_on_terminate
+    return process
+
+
+@pytest.fixture
+def mock_popen(monkeypatch):
+    """Replace subprocess.Popen so tests never launch a real mpv."""
+    mock = MagicMock()
+    monkeypatch.setattr("subprocess.Popen", mock)
+    return mock
+
+
+@pytest.fixture
+def started_player(mock_popen):
+    """Player that has started a (mocked) mpv process for a test video."""
+    mock_process = _popen_mock()
+    mock_popen.return_value = mock_process
+    player = Player()
+    player.play("http://localhost:8000/media/test.mp4")
+    return player, mock_process, mock_popen
 
 
 class TestPlayerInitialization:
@@ -25,16 +79,23 @@ class TestPlayerInitialization:
         assert player.fullscreen is False
         assert player.no_osc is False
 
+    def test_players_use_slots(self):
+        """Test that players store attributes in slots, not a __dict__."""
+        # Arrange & Act
+        players = [Player(), MpvIpcPlayer()]
+
+        # Assert
+        for player in players:
+            assert not hasattr(player, '__dict__')
+
 
 class TestPlayVideo:
     """Test video playback."""
 
-    @patch('subprocess.Popen')
     def test_play_starts_mpv_process(self, mock_popen):
         """Test that play() starts mpv process."""
         # Arrange
-        mock_process = Mock()
-        mock_process.poll.return_value = None  # Process is running
+        mock_process = _popen_mock()
         mock_popen.return_value = mock_process
         player = Player()
 
@@ -46,11 +107,10 @@ class TestPlayVideo:
         assert player.process is not None
         assert player.is_playing is True
 
-    @patch('subprocess.Popen')
     def test_play_uses_correct_mpv_arguments(self, mock_popen):
         """Test that play() uses correct mpv command arguments."""
         # Arrange
-        mock_process = Mock()
+        mock_process = _popen_mock()
         mock_popen.return_value = mock_process
         player = Player()
 
@@ -64,11 +124,55 @@ class TestPlayVideo:
         assert "--no-osc" in args
         assert "http://localhost:8000/media/test.mp4" in args
 
-    @patch('subprocess.Popen')
+    def test_play_uses_hardware_decoding_and_cache(self, mock_popen):
+        """Test that play() enables hardware decoding and the cache by default."""
+        # Arrange
+        mock_popen.return_value = _popen_mock()
+        player = Player()
+
+        # Act
+        player.play("http://localhost:8000/media/test.mp4")
+
+        # Assert
+        args = mock_popen.call_args[0][0]
+        assert "--hwdec=auto-safe" in args
+        assert "--vo=gpu,drm" in args
+        assert "--cache=yes" in args
+
+    def test_play_can_disable_hardware_options(self, mock_popen):
+        """Test that hardware-specific options can be turned off."""
+        # Arrange
+        mock_popen.return_value = _popen_mock()
+        player = Player(hwdec=None, vo=None, cache=False)
+
+        # Act
+        player.play("http://localhost:8000/media/test.mp4")
+
+        # Assert
+        args = mock_popen.call_args[0][0]
+        assert not any(arg.startswith(("--hwdec", "--vo", "--cache")) for arg in args)
+
+    def test_play_reuses_precomputed_command_prefix(self, mock_popen):
+        """Test that play() appends the URL to the prefix built in __init__."""
+        # Arrange
+        mock_popen.return_value = _popen_mock()
+        player = Player(fullscreen=False)
+
+        # Act
+        player.play("/home/user/one.mp4")
+        first_args = mock_popen.call_args[0][0]
+        player.play("/home/user/two.mp4")
+        second_args = mock_popen.call_args[0][0]
+
+        # Assert
+        assert first_args == (*player._mpv_prefix, "/home/user/one.mp4")
+        assert second_args == (*player._mpv_prefix, "/home/user/two.mp4")
+        assert "--fs" not in player._mpv_prefix
+
     def test_play_with_local_file_path(self, mock_popen):
         """Test playing a local file path."""
         # Arrange
-        mock_process = Mock()
+        mock_process = _popen_mock()
         mock_popen.return_value = mock_process
         player = Player()
 
@@ -80,13 +184,11 @@ class TestPlayVideo:
         args = mock_popen.call_args[0][0]
         assert "/home/user/video.mp4" in args
 
-    @patch('subprocess.Popen')
     def test_play_stops_existing_video_before_starting_new_one(self, mock_popen):
         """Test that playing new video stops existing one."""
         # Arrange
-        mock_process1 = Mock()
-        mock_process1.poll.return_value = None
-        mock_process2 = Mock()
+        mock_process1 = _popen_mock()
+        mock_process2 = _popen_mock()
         mock_popen.side_effect = [mock_process1, mock_process2]
         player = Player()
 
@@ -98,11 +200,10 @@ class TestPlayVideo:
         mock_process1.terminate.assert_called_once()
         assert player.process == mock_process2
 
-    @patch('subprocess.Popen')
     def test_play_sets_video_url(self, mock_popen):
         """Test that play() stores the current video URL."""
         # Arrange
-        mock_process = Mock()
+        mock_process = _popen_mock()
         mock_popen.return_value = mock_process
         player = Player()
 
@@ -112,19 +213,33 @@ class TestPlayVideo:
         # Assert
         assert player.current_url == "http://localhost:8000/media/test.mp4"
 
+    def test_play_uses_posix_spawn_friendly_arguments(self, mock_popen):
+        """Test that mpv is launched without pipes and with close_fds=False."""
+        # Arrange
+        mock_process = _popen_mock()
+        mock_popen.return_value = mock_process
+        player = Player()
+
+        # Act
+        player.play("http://localhost:8000/media/test.mp4")
+
+        # Assert
+        kwargs = mock_popen.call_args[1]
+        assert kwargs["close_fds"] is False
+        assert kwargs["executable"] == player._mpv_path
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert kwargs["stderr"] is not subprocess.PIPE
+        assert "preexec_fn" not in kwargs
+        assert "shell" not in kwargs
+
 
 class TestVideoStatus:
     """Test video playback status checks."""
 
-    @patch('subprocess.Popen')
-    def test_is_running_returns_true_when_playing(self, mock_popen):
+    def test_is_running_returns_true_when_playing(self, started_player):
         """Test that is_running() returns True when video is playing."""
         # Arrange
-        mock_process = Mock()
-        mock_process.poll.return_value = None  # None means still running
-        mock_popen.return_value = mock_process
-        player = Player()
-        player.play("http://localhost:8000/media/test.mp4")
+        player, _, _ = started_player
 
         # Act
         result = player.is_running()
@@ -132,15 +247,11 @@ class TestVideoStatus:
         # Assert
         assert result is True
 
-    @patch('subprocess.Popen')
-    def test_is_running_returns_false_when_finished(self, mock_popen):
+    def test_is_running_returns_false_when_finished(self, started_player):
         """Test that is_running() returns False when video finished."""
         # Arrange
-        mock_process = Mock()
+        player, mock_process, _ = started_player
         mock_process.poll.return_value = 0  # 0 means process finished
-        mock_popen.return_value = mock_process
-        player = Player()
-        player.play("http://localhost:8000/media/test.mp4")
 
         # Act
         result = player.is_running()
@@ -159,14 +270,10 @@ class TestVideoStatus:
         # Assert
         assert result is False
 
-    @patch('subprocess.Popen')
-    def test_wait_for_completion_blocks_until_video_ends(self, mock_popen):
+    def test_wait_for_completion_blocks_until_video_ends(self, started_player):
         """Test that wait_for_completion() waits for process to end."""
         # Arrange
-        mock_process = Mock()
-        mock_popen.return_value = mock_process
-        player = Player()
-        player.play("http://localhost:8000/media/test.mp4")
+        player, mock_process, _ = started_player
 
         # Act
         player.wait_for_completion()
@@ -174,16 +281,12 @@ class TestVideoStatus:
         # Assert
         mock_process.wait.assert_called_once()
 
-    @patch('subprocess.Popen')
-    def test_get_exit_code_returns_process_exit_code(self, mock_popen):
+    def test_get_exit_code_returns_process_exit_code(self, started_player):
         """Test that get_exit_code() returns the process exit code."""
         # Arrange
-        mock_process = Mock()
+        player, mock_process, _ = started_player
         mock_process.poll.return_value = 0
         mock_process.returncode = 0
-        mock_popen.return_value = mock_process
-        player = Player()
-        player.play("http://localhost:8000/media/test.mp4")
 
         # Act
         exit_code = player.get_exit_code()
@@ -195,15 +298,10 @@ class TestVideoStatus:
 class TestStopVideo:
     """Test stopping video playback."""
 
-    @patch('subprocess.Popen')
-    def test_stop_terminates_process(self, mock_popen):
+    def test_stop_terminates_process(self, started_player):
         """Test that stop() terminates the mpv process."""
         # Arrange
-        mock_process = Mock()
-        mock_process.poll.return_value = None
-        mock_popen.return_value = mock_process
-        player = Player()
-        player.play("http://localhost:8000/media/test.mp4")
+        player, mock_process, _ = started_player
 
         # Act
         player.stop()
@@ -212,7 +310,6 @@ class TestStopVideo:
         mock_process.terminate.assert_called_once()
         assert player.is_playing is False
 
-    @patch('subprocess.Popen')
     def test_stop_does_nothing_when_no_process(self, mock_popen):
         """Test that stop() handles no active process gracefully."""
         # Arrange
@@ -222,17 +319,13 @@ class TestStopVideo:
         player.stop()
         assert player.process is None
 
-    @patch('subprocess.Popen')
-    def test_stop_waits_for_graceful_shutdown(self, mock_popen):
+    def test_stop_waits_for_graceful_shutdown(self, started_player):
         """Test that stop() waits briefly for graceful shutdown."""
         # Arrange
-        mock_process = Mock()
+        player, mock_process, _ = started_player
         # First call returns None (still running), then 0 (finished)
         # Need to provide enough values for the loop
         mock_process.poll.side_effect = [None, None, 0] + [0] * 20
-        mock_popen.return_value = mock_process
-        player = Player()
-        player.play("http://localhost:8000/media/test.mp4")
 
         # Act
         player.stop()
@@ -246,7 +339,6 @@ class TestStopVideo:
 class TestErrorHandling:
     """Test error handling in video player."""
 
-    @patch('subprocess.Popen')
     def test_play_handles_mpv_not_found(self, mock_popen):
         """Test handling when mpv is not installed."""
         # Arrange
@@ -257,12 +349,10 @@ class TestErrorHandling:
         with pytest.raises(FileNotFoundError):
             player.play("http://localhost:8000/media/test.mp4")
 
-    @patch('subprocess.Popen')
     def test_play_handles_invalid_url(self, mock_popen):
         """Test handling of invalid video URL."""
         # Arrange
-        mock_process = Mock()
-        mock_process.poll.return_value = 1  # Non-zero exit = error
+        mock_process = _popen_mock(poll=1)  # Non-zero exit = error
         mock_popen.return_value = mock_process
         player = Player()
 
@@ -272,3 +362,218 @@ class TestErrorHandling:
         # Assert
         # Should still create process (mpv will handle the error)
         assert player.process is not None
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd requires Linux 5.3+")
+class TestStopRealProcess:
+    """Test stopping a real child process."""
+
+    def test_stop_returns_as_soon_as_process_exits(self):
+        """Test that stop() doesn't wait out the full timeout."""
+        # Arrange
+        player = Player()
+        player.process = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(30)"]
+        )
+        process = player.process
+
+        # Act
+        started = time.monotonic()
+        player.stop()
+        elapsed = time.monotonic() - started
+
+        # Assert
+        assert process.returncode is not None
+        assert elapsed < 1.0
+        assert player.process is None
+
+
+class FakeMpvServer:
+    """Minimal stand-in for mpv's JSON IPC socket."""
+
+    def __init__(self, socket_path, process):
+        self.socket_path = socket_path
+        self.process = process
+        self.commands = []
+        self.received = threading.Condition()
+        self.server = None
+        self.conn = None
+
+    def start(self):
+        """Listen on the socket path, as mpv does on startup."""
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(self.socket_path)
+        self.server.listen(1)
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        self.conn, _ = self.server.accept()
+        with self.conn.makefile("rb") as stream:
+            for line in stream:
+                command = json.loads(line)["command"]
+                with self.received:
+                    self.commands.append(command)
+                    self.received.notify_all()
+                if command[0] == "stop":
+                    self.send_event("end-file", reason="stop")
+                elif command[0] == "quit":
+                    self.process.poll.return_value = 0
+
+    def wait_for_commands(self, predicate, timeout=2.0):
+        """Wait until predicate(commands) is true or the timeout expires."""
+        with self.received:
+            return self.received.wait_for(lambda: predicate(self.commands), timeout)
+
+    def send_event(self, name, **fields):
+        """Send an event to the connected player."""
+        self.conn.sendall(json.dumps({"event": name, **fields}).encode() + b"\n")
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+        if self.server:
+            self.server.close()
+
+
+@pytest.fixture
+def fake_mpv(mock_popen):
+    """Make the mocked Popen open a fake mpv IPC socket when mpv starts."""
+    socket_dir = tempfile.mkdtemp()
+    socket_path = os.path.join(socket_dir, "mpv.sock")
+    process = _popen_mock()
+    fake = FakeMpvServer(socket_path, process)
+
+    def spawn(*args, **kwargs):
+        fake.start()
+        return process
+
+    mock_popen.side_effect = spawn
+    yield fake, mock_popen
+
+    fake.close()
+    shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+class TestMpvIpcPlayer:
+    """Test the persistent mpv player."""
+
+    def test_play_loads_video_over_ipc(self, fake_mpv):
+        """Test that play() sends a loadfile command to mpv."""
+        # Arrange
+        fake, mock_popen = fake_mpv
+        player = MpvIpcPlayer(socket_path=fake.socket_path)
+
+        # Act
+        player.play("http://localhost:8000/media/test.mp4")
+
+        # Assert
+        assert fake.wait_for_commands(lambda commands: commands)
+        assert fake.commands[0] == ["loadfile", "http://localhost:8000/media/test.mp4", "replace"]
+        args = mock_popen.call_args[0][0]
+        assert "--idle=yes" in args
+        assert f"--input-ipc-server={fake.socket_path}" in args
+        assert player.is_running() is True
+
+    def test_end_file_event_completes_playback(self, fake_mpv):
+        """Test that mpv's end-file event ends playback."""
+        # Arrange
+        fake, mock_popen = fake_mpv
+        player = MpvIpcPlayer(socket_path=fake.socket_path)
+        player.play("http://localhost:8000/media/test.mp4")
+
+        # Act
+        fake.send_event("end-file", reason="eof")
+
+        # Assert
+        assert player._playback_done.wait(timeout=2)
+        player.wait_for_completion()
+        assert player.is_running() is False
+        assert player.get_exit_code() == 0
+
+    def test_mpv_is_started_once_for_multiple_videos(self, fake_mpv):
+        """Test that consecutive videos reuse the same mpv process."""
+        # Arrange
+        fake, mock_popen = fake_mpv
+        player = MpvIpcPlayer(socket_path=fake.socket_path)
+        player.play("http://localhost:8000/media/video1.mp4")
+        fake.send_event("end-file", reason="eof")
+        player._playback_done.wait(timeout=2)
+
+        # Act
+        player.play("http://localhost:8000/media/video2.mp4")
+
+        # Assert
+        assert fake.wait_for_commands(lambda commands: len(commands) == 2)
+        assert mock_popen.call_count == 1
+        assert fake.commands[1][1] == "http://localhost:8000/media/video2.mp4"
+
+    def test_stop_keeps_mpv_running(self, fake_mpv):
+        """Test that stop() stops the video but not the mpv process."""
+        # Arrange
+        fake, mock_popen = fake_mpv
+        player = MpvIpcPlayer(socket_path=fake.socket_path)
+        player.play("http://localhost:8000/media/test.mp4")
+
+        # Act
+        player.stop()
+
+        # Assert
+        assert ["stop"] in fake.commands
+        assert player.is_running() is False
+        assert player.process is not None
+
+    def test_close_quits_mpv(self, fake_mpv):
+        """Test that close() shuts down the mpv process."""
+        # Arrange
+        fake, mock_popen = fake_mpv
+        player = MpvIpcPlayer(socket_path=fake.socket_path)
+        player.play("http://localhost:8000/media/test.mp4")
+
+        # Act
+        player.close()
+
+        # Assert
+        assert fake.wait_for_commands(lambda commands: ["quit"] in commands)
+        assert player.process is None
+
+    def test_failed_video_logs_only_its_own_stderr(self, fake_mpv, caplog):
+        """Test that a failure logs mpv's output since the current video was loaded."""
+        # Arrange
+        fake, mock_popen = fake_mpv
+        player = MpvIpcPlayer(socket_path=fake.socket_path)
+        player.play("http://localhost:8000/media/video1.mp4")
+        stderr = mock_popen.call_args.kwargs["stderr"]
+        stderr.write(b"warning from video1\n")
+        stderr.flush()
+        fake.send_event("end-file", reason="eof")
+        player._playback_done.wait(timeout=2)
+
+        player.play("http://localhost:8000/media/video2.mp4")
+        stderr.write(b"error from video2\n")
+        stderr.flush()
+
+        # Act
+        fake.send_event("end-file", reason="error")
+        with caplog.at_level("WARNING"):
+            player.wait_for_completion()
+
+        # Assert
+        assert "error from video2" in caplog.text
+        assert "warning from video1" not in caplog.text
+
+    def test_stderr_read_is_capped(self, fake_mpv, monkeypatch):
+        """Test that only the tail of a long stderr log is read."""
+        # Arrange
+        fake, mock_popen = fake_mpv
+        monkeypatch.setattr(MpvIpcPlayer, "STDERR_READ_LIMIT", 8)
+        player = MpvIpcPlayer(socket_path=fake.socket_path)
+        player.play("http://localhost:8000/media/test.mp4")
+        stderr = mock_popen.call_args.kwargs["stderr"]
+        stderr.write(b"0123456789abcdef")
+        stderr.flush()
+
+        # Act
+        output = player._read_stderr(player._stderr_offset)
+
+        # Assert
+        assert output == "89abcdef"
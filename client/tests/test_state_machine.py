@@ -23,151 +23,57 @@ class TestStateMachineInitialization:
         assert hasattr(State, 'PLAYING')
         assert hasattr(State, 'ERROR')
 
-
-class TestIdleState:
-    """Test transitions from IDLE state."""
-
-    def test_button_press_in_idle_transitions_to_loading(self):
-        """Test IDLE → LOADING transition on button press."""
-        # Arrange
-        sm = StateMachine()
-
-        # Act
-        new_state = sm.on_button_press()
-
-        # Assert
-        assert sm.current_state == State.LOADING
-        assert new_state == State.LOADING
-
-    def test_button_press_in_idle_returns_loading_state(self):
-        """Test that button press returns the new state."""
-        # Arrange
-        sm = StateMachine()
-
-        # Act
-        new_state = sm.on_button_press()
-
-        # Assert
-        assert new_state == State.LOADING
-
-
-class TestLoadingState:
-    """Test transitions from LOADING state."""
-
-    def test_video_ready_in_loading_transitions_to_playing(self):
-        """Test LOADING → PLAYING transition when video ready."""
-        # Arrange
-        sm = StateMachine()
-        sm.on_button_press()  # Move to LOADING
-
-        # Act
-        new_state = sm.on_video_ready()
-
-        # Assert
-        assert sm.current_state == State.PLAYING
-        assert new_state == State.PLAYING
-
-    def test_button_press_in_loading_stays_in_loading(self):
-        """Test that button press in LOADING state is ignored."""
-        # Arrange
-        sm = StateMachine()
-        sm.on_button_press()  # Move to LOADING
-
-        # Act
-        new_state = sm.on_button_press()
-
-        # Assert
-        assert sm.current_state == State.LOADING
-        assert new_state == State.LOADING
-
-    def test_error_in_loading_transitions_to_error(self):
-        """Test LOADING → ERROR transition on error."""
-        # Arrange
-        sm = StateMachine()
-        sm.on_button_press()  # Move to LOADING
-
-        # Act
-        new_state = sm.on_error("Network error")
-
-        # Assert
-        assert sm.current_state == State.ERROR
-        assert new_state == State.ERROR
-
-
-class TestPlayingState:
-    """Test transitions from PLAYING state."""
-
-    def test_video_end_in_playing_transitions_to_idle(self):
-        """Test PLAYING → IDLE transition when video ends."""
-        # Arrange
+    def test_state_machine_uses_slots(self):
+        """Test that state machine attributes live in slots, not a __dict__."""
+        # Arrange & Act
         sm = StateMachine()
-        sm.on_button_press()  # IDLE → LOADING
-        sm.on_video_ready()    # LOADING → PLAYING
-
-        # Act
-        new_state = sm.on_video_end()
 
         # Assert
-        assert sm.current_state == State.IDLE
-        assert new_state == State.IDLE
+        assert not hasattr(sm, '__dict__')
 
-    def test_button_press_in_playing_stays_in_playing(self):
-        """Test that button press during playback is ignored."""
-        # Arrange
-        sm = StateMachine()
-        sm.on_button_press()  # IDLE → LOADING
-        sm.on_video_ready()    # LOADING → PLAYING
 
-        # Act
-        new_state = sm.on_button_press()
+def fire(sm, event):
+    """Send an event to the state machine by handler name."""
+    if event == "on_error":
+        return sm.on_error("Test error")
+    return getattr(sm, event)()
 
-        # Assert
-        assert sm.current_state == State.PLAYING
-        assert new_state == State.PLAYING
-
-    def test_error_in_playing_transitions_to_error(self):
-        """Test PLAYING → ERROR transition on error."""
-        # Arrange
-        sm = StateMachine()
-        sm.on_button_press()
-        sm.on_video_ready()
-
-        # Act
-        new_state = sm.on_error("Playback error")
-
-        # Assert
-        assert sm.current_state == State.ERROR
 
+# (events leading up to the test, event under test, expected state)
+TRANSITIONS = [
+    # IDLE
+    ([], "on_button_press", State.LOADING),
+    # LOADING
+    (["on_button_press"], "on_video_ready", State.PLAYING),
+    (["on_button_press"], "on_button_press", State.LOADING),
+    (["on_button_press"], "on_error", State.ERROR),
+    # PLAYING
+    (["on_button_press", "on_video_ready"], "on_video_end", State.IDLE),
+    (["on_button_press", "on_video_ready"], "on_button_press", State.PLAYING),
+    (["on_button_press", "on_video_ready"], "on_error", State.ERROR),
+    # ERROR
+    (["on_button_press", "on_error"], "on_error_recovery", State.IDLE),
+    (["on_button_press", "on_error"], "on_button_press", State.ERROR),
+]
 
-class TestErrorState:
-    """Test transitions from ERROR state."""
 
-    def test_error_auto_recovers_to_idle_after_timeout(self):
-        """Test ERROR → IDLE transition after recovery."""
-        # Arrange
-        sm = StateMachine()
-        sm.on_button_press()
-        sm.on_error("Test error")
-
-        # Act
-        new_state = sm.on_error_recovery()
+class TestTransitions:
+    """Test the result of each event in each state."""
 
-        # Assert
-        assert sm.current_state == State.IDLE
-        assert new_state == State.IDLE
-
-    def test_button_press_in_error_stays_in_error(self):
-        """Test that button press in ERROR state is ignored."""
+    @pytest.mark.parametrize("setup,event,expected", TRANSITIONS)
+    def test_transition(self, setup, event, expected):
+        """Test that an event moves the machine to the expected state."""
         # Arrange
         sm = StateMachine()
-        sm.on_button_press()
-        sm.on_error("Test error")
+        for setup_event in setup:
+            fire(sm, setup_event)
 
         # Act
-        new_state = sm.on_button_press()
+        new_state = fire(sm, event)
 
         # Assert
-        assert sm.current_state == State.ERROR
+        assert sm.current_state == expected
+        assert new_state == expected
 
 
 class TestStateHistory:
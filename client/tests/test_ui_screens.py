@@ -1,145 +1,126 @@
 """Playwright tests for UI screens."""
 import pytest
-import os
 from playwright.sync_api import Page, expect
-import threading
-import time
-from src.web_server import WebServer
 
-# Skip Playwright tests in containerized environments where Chromium has issues
-# Set ENABLE_PLAYWRIGHT_TESTS=1 to run these tests
-pytestmark = pytest.mark.skipif(
-    os.getenv("ENABLE_PLAYWRIGHT_TESTS") != "1",
-    reason="Playwright tests require proper display environment. "
-           "Set ENABLE_PLAYWRIGHT_TESTS=1 to enable."
-)
+# Only collected when ENABLE_PLAYWRIGHT_TESTS=1 (see conftest.py), since
+# Chromium has issues in containerized environments
 
 
-@pytest.fixture(scope="module")
-def web_server():
-    """Start web server for testing."""
-    server = WebServer(port=5001)
-    server.start()
-    time.sleep(1)  # Give server time to start
-    yield server
-    server.stop()
+def open_screen(page: Page, path: str = "/"):
+    """
+    Navigate to a UI screen without waiting for the full load event.
+
+    The expect() assertions retry until their element appears, so waiting
+    for every subresource first only slows the tests down.
+    """
+    return page.goto(
+        f"http://localhost:5001{path}", wait_until="domcontentloaded", timeout=10000
+    )
+
+
+@pytest.fixture(scope="class")
+def loaded_page(shared_context, web_server, request):
+    """
+    Page opened once on the test class's `screen` and shared by its tests.
+
+    The screens are static, so the read-only checks in a class can run
+    against one loaded DOM instead of navigating before every test.
+    """
+    page = shared_context.new_page()
+    page.set_default_timeout(5000)
+    open_screen(page, request.cls.screen)
+    yield page
+    page.close()
 
 
 class TestSplashScreen:
     """Test splash screen UI."""
 
-    def test_splash_screen_loads(self, page: Page, web_server):
-        """Test that splash screen loads successfully."""
-        # Navigate to splash screen
-        page.goto("http://localhost:5001/")
+    screen = "/"
 
+    def test_splash_screen_loads(self, loaded_page: Page):
+        """Test that splash screen loads successfully."""
         # Check that page loaded
-        expect(page).to_have_title("BobaVision - Splash")
+        expect(loaded_page).to_have_title("BobaVision - Splash")
 
-    def test_splash_screen_has_logo(self, page: Page, web_server):
+    def test_splash_screen_has_logo(self, loaded_page: Page):
         """Test that splash screen displays logo."""
-        page.goto("http://localhost:5001/")
-
         # Check for logo element
-        logo = page.locator(".logo")
+        logo = loaded_page.locator(".logo")
         expect(logo).to_be_visible()
 
-    def test_splash_screen_has_title(self, page: Page, web_server):
+    def test_splash_screen_has_title(self, loaded_page: Page):
         """Test that splash screen displays title."""
-        page.goto("http://localhost:5001/")
-
         # Check for title
-        title = page.locator(".title")
+        title = loaded_page.locator(".title")
         expect(title).to_be_visible()
         expect(title).to_contain_text("BobaVision")
 
-    def test_splash_screen_has_tagline(self, page: Page, web_server):
+    def test_splash_screen_has_tagline(self, loaded_page: Page):
         """Test that splash screen displays tagline."""
-        page.goto("http://localhost:5001/")
-
         # Check for tagline
-        tagline = page.locator(".tagline")
+        tagline = loaded_page.locator(".tagline")
         expect(tagline).to_be_visible()
         expect(tagline).to_contain_text("Press the button")
 
-    def test_splash_screen_loads_css(self, page: Page, web_server):
+    def test_splash_screen_loads_css(self, loaded_page: Page):
         """Test that splash screen loads CSS files."""
-        page.goto("http://localhost:5001/")
-
         # Check that CSS is applied by verifying computed styles
-        container = page.locator(".splash-container")
+        container = loaded_page.locator(".splash-container")
         expect(container).to_be_visible()
 
-    def test_splash_screen_loads_javascript(self, page: Page, web_server):
+    def test_splash_screen_loads_javascript(self, loaded_page: Page):
         """Test that splash screen loads JavaScript."""
-        page.goto("http://localhost:5001/")
-
         # Check that script loaded (state_handler.js logs to console)
         # We can verify by checking for the script tag
-        expect(page.locator('script[src="/scripts/state_handler.js"]')).to_be_attached()
+        expect(loaded_page.locator('script[src="/scripts/state_handler.js"]')).to_be_attached()
+
+
+class TestStatusScreens:
+    """Test the screens shown while loading, when done and on error."""
+
+    @pytest.mark.parametrize("path,title,selector,text", [
+        ("/loading.html", "BobaVision - Loading", ".message", "Getting your video ready"),
+        ("/all_done.html", "BobaVision - All Done", ".title", "Great Watching"),
+        ("/error.html", "BobaVision - Oops", ".title", "Oops"),
+    ])
+    def test_status_screen_displays(self, page: Page, web_server, path, title, selector, text):
+        """Test that each status screen loads with its heading text."""
+        open_screen(page, path)
+
+        expect(page).to_have_title(title)
+        element = page.locator(selector)
+        expect(element).to_be_visible()
+        expect(element).to_contain_text(text)
 
 
 class TestLoadingScreen:
     """Test loading screen UI."""
 
-    def test_loading_screen_loads(self, page: Page, web_server):
-        """Test that loading screen loads successfully."""
-        page.goto("http://localhost:5001/loading.html")
-
-        # Check that page loaded
-        expect(page).to_have_title("BobaVision - Loading")
+    screen = "/loading.html"
 
-    def test_loading_screen_has_spinner(self, page: Page, web_server):
+    def test_loading_screen_has_spinner(self, loaded_page: Page):
         """Test that loading screen displays spinner."""
-        page.goto("http://localhost:5001/loading.html")
-
         # Check for spinner element
-        spinner = page.locator(".spinner")
+        spinner = loaded_page.locator(".spinner")
         expect(spinner).to_be_visible()
 
-    def test_loading_screen_has_message(self, page: Page, web_server):
-        """Test that loading screen displays loading message."""
-        page.goto("http://localhost:5001/loading.html")
-
-        # Check for loading message
-        message = page.locator(".message")
-        expect(message).to_be_visible()
-        expect(message).to_contain_text("Getting your video ready")
-
 
 class TestAllDoneScreen:
     """Test 'all done' screen UI."""
 
-    def test_all_done_screen_loads(self, page: Page, web_server):
-        """Test that 'all done' screen loads successfully."""
-        page.goto("http://localhost:5001/all_done.html")
+    screen = "/all_done.html"
 
-        # Check that page loaded
-        expect(page).to_have_title("BobaVision - All Done")
-
-    def test_all_done_screen_has_celebration(self, page: Page, web_server):
+    def test_all_done_screen_has_celebration(self, loaded_page: Page):
         """Test that 'all done' screen displays celebration elements."""
-        page.goto("http://localhost:5001/all_done.html")
-
         # Check for celebration element
-        celebration = page.locator(".celebration")
+        celebration = loaded_page.locator(".celebration")
         expect(celebration).to_be_visible()
 
-    def test_all_done_screen_has_title(self, page: Page, web_server):
-        """Test that 'all done' screen displays title."""
-        page.goto("http://localhost:5001/all_done.html")
-
-        # Check for title
-        title = page.locator(".title")
-        expect(title).to_be_visible()
-        expect(title).to_contain_text("Great Watching")
-
-    def test_all_done_screen_has_message(self, page: Page, web_server):
+    def test_all_done_screen_has_message(self, loaded_page: Page):
         """Test that 'all done' screen displays message."""
-        page.goto("http://localhost:5001/all_done.html")
-
         # Check for message
-        message = page.locator(".message")
+        message = loaded_page.locator(".message")
         expect(message).to_be_visible()
         expect(message).to_contain_text("all your videos")
 
@@ -147,45 +128,25 @@ class TestAllDoneScreen:
 class TestErrorScreen:
     """Test error screen UI."""
 
-    def test_error_screen_loads(self, page: Page, web_server):
-        """Test that error screen loads successfully."""
-        page.goto("http://localhost:5001/error.html")
-
-        # Check that page loaded
-        expect(page).to_have_title("BobaVision - Oops")
+    screen = "/error.html"
 
-    def test_error_screen_has_icon(self, page: Page, web_server):
+    def test_error_screen_has_icon(self, loaded_page: Page):
         """Test that error screen displays icon."""
-        page.goto("http://localhost:5001/error.html")
-
         # Check for icon element
-        icon = page.locator(".icon")
+        icon = loaded_page.locator(".icon")
         expect(icon).to_be_visible()
 
-    def test_error_screen_has_title(self, page: Page, web_server):
-        """Test that error screen displays title."""
-        page.goto("http://localhost:5001/error.html")
-
-        # Check for title
-        title = page.locator(".title")
-        expect(title).to_be_visible()
-        expect(title).to_contain_text("Oops")
-
-    def test_error_screen_has_message(self, page: Page, web_server):
+    def test_error_screen_has_message(self, loaded_page: Page):
         """Test that error screen displays friendly message."""
-        page.goto("http://localhost:5001/error.html")
-
         # Check for message
-        message = page.locator(".message")
+        message = loaded_page.locator(".message")
         expect(message).to_be_visible()
         expect(message).to_contain_text("went wrong")
 
-    def test_error_screen_has_retry_countdown(self, page: Page, web_server):
+    def test_error_screen_has_retry_countdown(self, loaded_page: Page):
         """Test that error screen displays retry countdown."""
-        page.goto("http://localhost:5001/error.html")
-
         # Check for retry element
-        retry = page.locator(".retry")
+        retry = loaded_page.locator(".retry")
         expect(retry).to_be_visible()
         expect(retry).to_contain_text("Trying again")
 
@@ -195,7 +156,7 @@ class TestResponsiveDesign:
 
     def test_splash_screen_is_responsive(self, page: Page, web_server):
         """Test that splash screen adapts to different viewports."""
-        page.goto("http://localhost:5001/")
+        open_screen(page)
 
         # Test different viewport sizes
         viewports = [
@@ -209,18 +170,17 @@ class TestResponsiveDesign:
             # Check that content is still visible
             expect(page.locator(".splash-container")).to_be_visible()
 
-    def test_all_screens_have_no_horizontal_scroll(self, page: Page, web_server):
-        """Test that screens don't cause horizontal scrolling."""
-        screens = ["/", "/loading.html", "/all_done.html", "/error.html"]
-
-        for screen in screens:
-            page.goto(f"http://localhost:5001{screen}")
+    @pytest.mark.parametrize("screen", ["/", "/loading.html", "/all_done.html", "/error.html"])
+    def test_screen_has_no_horizontal_scroll(self, page: Page, web_server, screen):
+        """Test that a screen doesn't cause horizontal scrolling."""
+        # Wait for the full load event so stylesheets are applied
+        page.goto(f"http://localhost:5001{screen}")
 
-            # Check that body width doesn't exceed viewport
-            # This prevents horizontal scroll
-            body_width = page.evaluate("document.body.scrollWidth")
-            viewport_width = page.viewport_size["width"]
-            assert body_width <= viewport_width, f"Screen {screen} causes horizontal scroll"
+        # Check that body width doesn't exceed viewport
+        # This prevents horizontal scroll
+        body_width = page.evaluate("document.body.scrollWidth")
+        viewport_width = page.viewport_size["width"]
+        assert body_width <= viewport_width, f"Screen {screen} causes horizontal scroll"
 
 
 class TestAccessibility:
@@ -228,25 +188,23 @@ class TestAccessibility:
 
     def test_splash_screen_has_proper_structure(self, page: Page, web_server):
         """Test that splash screen has semantic HTML structure."""
-        page.goto("http://localhost:5001/")
+        open_screen(page)
 
         # Check that page has proper HTML5 structure
         expect(page.locator("html[lang]")).to_be_attached()
         expect(page.locator("meta[charset]")).to_be_attached()
         expect(page.locator("meta[name='viewport']")).to_be_attached()
 
-    def test_all_screens_have_titles(self, page: Page, web_server):
-        """Test that all screens have descriptive titles."""
-        screens_and_titles = [
-            ("/", "BobaVision - Splash"),
-            ("/loading.html", "BobaVision - Loading"),
-            ("/all_done.html", "BobaVision - All Done"),
-            ("/error.html", "BobaVision - Oops"),
-        ]
-
-        for screen, expected_title in screens_and_titles:
-            page.goto(f"http://localhost:5001{screen}")
-            expect(page).to_have_title(expected_title)
+    @pytest.mark.parametrize("screen,expected_title", [
+        ("/", "BobaVision - Splash"),
+        ("/loading.html", "BobaVision - Loading"),
+        ("/all_done.html", "BobaVision - All Done"),
+        ("/error.html", "BobaVision - Oops"),
+    ])
+    def test_screen_has_title(self, page: Page, web_server, screen, expected_title):
+        """Test that a screen has a descriptive title."""
+        open_screen(page, screen)
+        expect(page).to_have_title(expected_title)
 
 
 class TestStaticAssets:
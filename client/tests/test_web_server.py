@@ -1,7 +1,30 @@
 """Tests for web server that serves UI assets."""
+import threading
+
+import httpx
 import pytest
-from unittest.mock import Mock, patch
-from src.web_server import WebServer
+from unittest.mock import patch
+from src.web_server import STATIC_MAX_AGE, WebServer
+
+
+@pytest.fixture(scope="module")
+def shared_server():
+    """One WebServer (and Flask app) shared by the request-level tests."""
+    return WebServer(port=5000)
+
+
+@pytest.fixture
+def client(shared_server):
+    """Fresh Flask test client for the shared app."""
+    return shared_server.app.test_client()
+
+
+@pytest.fixture
+def serving_mocks():
+    """Patch src.web_server's make_server and Thread for lifecycle tests."""
+    with patch('src.web_server.make_server') as mock_make_server, \
+            patch('src.web_server.Thread') as mock_thread:
+        yield mock_make_server, mock_thread
 
 
 class TestWebServerInitialization:
@@ -39,12 +62,8 @@ class TestWebServerInitialization:
 class TestWebServerStaticFileServing:
     """Test serving static HTML files."""
 
-    def test_server_serves_splash_html(self):
+    def test_server_serves_splash_html(self, client):
         """Test that server serves splash.html at root path."""
-        # Arrange
-        server = WebServer(port=5000)
-        client = server.app.test_client()
-
         # Act
         response = client.get('/')
 
@@ -52,12 +71,8 @@ class TestWebServerStaticFileServing:
         assert response.status_code == 200
         assert b'splash' in response.data.lower() or response.content_type == 'text/html'
 
-    def test_server_serves_loading_html(self):
+    def test_server_serves_loading_html(self, client):
         """Test that server serves loading.html."""
-        # Arrange
-        server = WebServer(port=5000)
-        client = server.app.test_client()
-
         # Act
         response = client.get('/loading.html')
 
@@ -65,12 +80,8 @@ class TestWebServerStaticFileServing:
         assert response.status_code == 200
         assert response.content_type == 'text/html; charset=utf-8'
 
-    def test_server_serves_css_files(self):
+    def test_server_serves_css_files(self, client):
         """Test that server serves CSS files from styles directory."""
-        # Arrange
-        server = WebServer(port=5000)
-        client = server.app.test_client()
-
         # Act
         response = client.get('/styles/common.css')
 
@@ -80,12 +91,8 @@ class TestWebServerStaticFileServing:
         if response.status_code == 200:
             assert 'text/css' in response.content_type
 
-    def test_server_serves_javascript_files(self):
+    def test_server_serves_javascript_files(self, client):
         """Test that server serves JavaScript files from scripts directory."""
-        # Arrange
-        server = WebServer(port=5000)
-        client = server.app.test_client()
-
         # Act
         response = client.get('/scripts/state_handler.js')
 
@@ -96,13 +103,56 @@ class TestWebServerStaticFileServing:
             assert 'javascript' in response.content_type or 'text' in response.content_type
 
 
+class TestWebServerCaching:
+    """Test HTTP caching of static assets."""
+
+    def test_css_files_are_cacheable(self, client):
+        """Test that CSS responses allow the browser to cache them."""
+        # Act
+        response = client.get('/styles/common.css')
+
+        # Assert
+        assert response.status_code == 200
+        assert response.cache_control.public is True
+        assert response.cache_control.max_age == STATIC_MAX_AGE
+
+    def test_unchanged_script_returns_not_modified(self, client):
+        """Test that a conditional GET with a matching ETag returns 304."""
+        # Arrange
+        etag = client.get('/scripts/state_handler.js').headers['ETag']
+
+        # Act
+        response = client.get(
+            '/scripts/state_handler.js',
+            headers={'If-None-Match': etag}
+        )
+
+        # Assert
+        assert response.status_code == 304
+
+    def test_html_pages_are_revalidated(self, client):
+        """Test that HTML entry points are revalidated by ETag on every load."""
+        # Arrange
+        first = client.get('/loading.html')
+
+        # Act
+        response = client.get(
+            '/loading.html',
+            headers={'If-None-Match': first.headers['ETag']}
+        )
+
+        # Assert
+        assert first.cache_control.no_cache is True
+        assert response.status_code == 304
+
+
 class TestWebServerLifecycle:
-    """Test web server lifecycle management."""
+    """Test web server lifecycle management without a real server."""
 
-    @patch('threading.Thread')
-    def test_server_start_runs_in_background_thread(self, mock_thread):
+    def test_server_start_runs_in_background_thread(self, serving_mocks):
         """Test that server.start() runs Flask in a background thread."""
         # Arrange
+        _, mock_thread = serving_mocks
         server = WebServer(port=5000)
 
         # Act
@@ -112,15 +162,73 @@ class TestWebServerLifecycle:
         mock_thread.assert_called_once()
         thread_args = mock_thread.call_args
         assert thread_args[1]['daemon'] is True
+        mock_thread.return_value.start.assert_called_once()
 
-    @patch('flask.Flask.run')
-    def test_server_stop_shuts_down_gracefully(self, mock_run):
+    def test_server_stop_shuts_down_gracefully(self, serving_mocks):
         """Test that server.stop() shuts down gracefully."""
         # Arrange
+        mock_make_server, _ = serving_mocks
         server = WebServer(port=5000)
+        server.start()
 
         # Act
         server.stop()
 
         # Assert
         assert server.running is False
+        mock_make_server.return_value.shutdown.assert_called_once()
+        mock_make_server.return_value.server_close.assert_called_once()
+
+
+class TestWebServerRealServer:
+    """Test web server behaviour on a real port."""
+
+    def test_server_stop_releases_port(self):
+        """Test that stop() ends the serving thread so the port can be reused."""
+        # Arrange
+        server = WebServer(port=5002)
+        server.start()
+        thread = server.thread
+
+        # Act
+        server.stop()
+        thread.join(timeout=2)
+
+        # Assert
+        assert not thread.is_alive()
+        assert server.server is None
+        server.start()
+        server.stop()
+
+    def test_server_serves_requests_concurrently(self):
+        """Test that a slow request does not block other requests."""
+        # Arrange
+        server = WebServer(port=5003)
+        started = threading.Event()
+        release = threading.Event()
+
+        @server.app.route('/slow')
+        def slow():
+            started.set()
+            release.wait(timeout=5)
+            return 'done'
+
+        server.start()
+        slow_thread = threading.Thread(
+            target=httpx.get, args=(f"{server.get_url()}/slow",), kwargs={"timeout": 5}
+        )
+        slow_thread.start()
+
+        try:
+            assert started.wait(timeout=5)
+
+            # Act
+            response = httpx.get(server.get_url(), timeout=2)
+
+            # Assert
+            assert response.status_code == 200
+            assert slow_thread.is_alive()
+        finally:
+            release.set()
+            slow_thread.join(timeout=5)
+            server.stop()
@@ -3,13 +3,24 @@
 Diagnostic script to check database state for limit enforcement debugging.
 """
 import sqlite3
-from datetime import datetime
+from datetime import datetime, time, timedelta
 
 # Connect to database
 db_path = "bobavision.db"
 conn = sqlite3.connect(db_path)
 cursor = conn.cursor()
 
+# Read everything inside one transaction so all sections see the same snapshot
+cursor.execute("BEGIN")
+
+# Half-open bounds for today (UTC, matching how played_at is stored), so
+# played_at is compared directly and its index can be used
+today_start = datetime.combine(datetime.utcnow().date(), time.min)
+today_bounds = {
+    "start": today_start.isoformat(sep=" "),
+    "next_day": (today_start + timedelta(days=1)).isoformat(sep=" "),
+}
+
 print("=" * 70)
 print("BOBAVISION DATABASE DIAGNOSTIC")
 print("=" * 70)
@@ -31,10 +42,10 @@ else:
 # Check videos
 print("\n2. VIDEOS IN DATABASE")
 print("-" * 70)
-cursor.execute("SELECT COUNT(*) FROM videos WHERE is_placeholder = 0")
-real_count = cursor.fetchone()[0]
-cursor.execute("SELECT COUNT(*) FROM videos WHERE is_placeholder = 1")
-placeholder_count = cursor.fetchone()[0]
+cursor.execute("SELECT is_placeholder, COUNT(*) FROM videos GROUP BY is_placeholder")
+video_counts = dict(cursor.fetchall())
+real_count = video_counts.get(0, 0)
+placeholder_count = video_counts.get(1, 0)
 print(f"  Real videos: {real_count}")
 print(f"  Placeholder videos: {placeholder_count}")
 
@@ -58,9 +69,9 @@ cursor.execute("""
            SUM(CASE WHEN is_placeholder = 0 THEN 1 ELSE 0 END) as real_plays,
            SUM(CASE WHEN is_placeholder = 1 THEN 1 ELSE 0 END) as placeholder_plays
     FROM play_log
-    WHERE date(played_at) = date('now')
+    WHERE played_at >= :start AND played_at < :next_day
     GROUP BY client_id
-""")
+""", today_bounds)
 play_stats = cursor.fetchall()
 
 if play_stats:
@@ -76,13 +87,19 @@ else:
 # Check recent plays for local-test-client
 print("\n4. RECENT PLAYS FOR 'local-test-client'")
 print("-" * 70)
+# Take the 10 newest plays from the (client_id, played_at) index first, then
+# look up just those videos, instead of joining the client's whole history
 cursor.execute("""
     SELECT p.id, p.played_at, p.is_placeholder, v.title
-    FROM play_log p
+    FROM (
+        SELECT id, played_at, is_placeholder, video_id
+        FROM play_log
+        WHERE client_id = 'local-test-client'
+        ORDER BY played_at DESC
+        LIMIT 10
+    ) p
     JOIN videos v ON p.video_id = v.id
-    WHERE p.client_id = 'local-test-client'
     ORDER BY p.played_at DESC
-    LIMIT 10
 """)
 recent_plays = cursor.fetchall()
 if recent_plays:
@@ -104,9 +121,9 @@ daily_limit = limit_result[0] if limit_result else 3
 cursor.execute("""
     SELECT COUNT(*) FROM play_log
     WHERE client_id = 'local-test-client'
-    AND date(played_at) = date('now')
+    AND played_at >= :start AND played_at < :next_day
     AND is_placeholder = 0
-""")
+""", today_bounds)
 plays_today = cursor.fetchone()[0]
 
 print(f"  Daily Limit: {daily_limit}")
@@ -118,6 +135,7 @@ if plays_today >= daily_limit and placeholder_count == 0:
     print("  Limit is reached but there are no placeholder videos!")
     print("  The system will fail to enforce the limit.")
 
+conn.rollback()
 conn.close()
 
 print("\n" + "=" * 70)
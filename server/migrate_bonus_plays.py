@@ -33,6 +33,11 @@ def migrate():
     cursor = conn.cursor()
 
     try:
+        # Switch to WAL (not allowed inside a transaction), then apply all
+        # changes in a single transaction
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("BEGIN")
+
         # Check and add bonus_plays_count column
         if not check_column_exists(cursor, "client_settings", "bonus_plays_count"):
             print("Adding bonus_plays_count column...")
@@ -53,8 +58,12 @@ def migrate():
         else:
             print("✓ bonus_plays_date column already exists")
 
+        # Refresh planner statistics for the new schema
+        cursor.execute("ANALYZE")
+
         # Commit changes
         conn.commit()
+        cursor.execute("PRAGMA optimize")
         print("\n✓ Migration completed successfully!")
         return 0
 
@@ -0,0 +1,74 @@
+"""Migration script to add query indexes to existing databases.
+
+This script adds:
+- ix_play_log_client_played_at on play_log(client_id, played_at)
+- ix_queue_client_position on queue(client_id, position)
+
+Run this script once to upgrade existing databases.
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+INDEXES = {
+    "ix_play_log_client_played_at": "play_log(client_id, played_at)",
+    "ix_queue_client_position": "queue(client_id, position)",
+}
+
+def check_index_exists(cursor, index_name):
+    """Check if an index exists in the database."""
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+        (index_name,)
+    )
+    return cursor.fetchone() is not None
+
+def migrate():
+    """Create missing indexes."""
+    # Get database path
+    db_path = Path(__file__).parent / "bobavision.db"
+
+    if not db_path.exists():
+        print(f"Database not found at {db_path}")
+        print("No migration needed - database will be created with new schema.")
+        return 0
+
+    print(f"Migrating database at {db_path}")
+
+    # Connect to database
+    conn = sqlite3.connect(str(db_path))
+    cursor = conn.cursor()
+
+    try:
+        # Switch to WAL (not allowed inside a transaction), then apply all
+        # changes in a single transaction
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("BEGIN")
+
+        for index_name, target in INDEXES.items():
+            if not check_index_exists(cursor, index_name):
+                print(f"Creating {index_name}...")
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {target}")
+                print(f"✓ Created {index_name}")
+            else:
+                print(f"✓ {index_name} already exists")
+
+        # Refresh planner statistics for the new schema
+        cursor.execute("ANALYZE")
+
+        # Commit changes
+        conn.commit()
+        cursor.execute("PRAGMA optimize")
+        print("\n✓ Migration completed successfully!")
+        return 0
+
+    except Exception as e:
+        print(f"\n✗ Migration failed: {e}")
+        conn.rollback()
+        return 1
+
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    sys.exit(migrate())
@@ -0,0 +1,89 @@
+"""Migration script to add the video_tags table and backfill it.
+
+This script adds:
+- video_tags table (video_id, tag) with one row per tag
+- ix_video_tags_tag index on video_tags(tag)
+
+Existing comma-separated videos.tags values are copied into video_tags.
+The tags column is kept so older code keeps working.
+
+The server runs the same backfill on startup (init_db), so this script
+is only needed to upgrade a database without starting the server.
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+from src.db.tags import split_tags
+
+def migrate():
+    """Create video_tags and fill it from videos.tags."""
+    # Get database path
+    db_path = Path(__file__).parent / "bobavision.db"
+
+    if not db_path.exists():
+        print(f"Database not found at {db_path}")
+        print("No migration needed - database will be created with new schema.")
+        return 0
+
+    print(f"Migrating database at {db_path}")
+
+    # Connect to database
+    conn = sqlite3.connect(str(db_path))
+    cursor = conn.cursor()
+
+    try:
+        # Switch to WAL and skip per-row FK checks for the backfill (neither
+        # can change inside a transaction), then apply all changes in a
+        # single transaction
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA foreign_keys=OFF")
+        cursor.execute("BEGIN")
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS video_tags (
+                video_id INTEGER NOT NULL REFERENCES videos (id) ON DELETE CASCADE,
+                tag VARCHAR NOT NULL,
+                PRIMARY KEY (video_id, tag)
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_video_tags_tag ON video_tags (tag)")
+        print("✓ video_tags table ready")
+
+        cursor.execute("SELECT id, tags FROM videos WHERE tags IS NOT NULL")
+        rows = [
+            (video_id, tag)
+            for video_id, tags in cursor.fetchall()
+            for tag in split_tags(tags)
+        ]
+        cursor.executemany(
+            "INSERT OR IGNORE INTO video_tags (video_id, tag) VALUES (?, ?)", rows
+        )
+        print(f"✓ Backfilled {len(rows)} video tags")
+
+        # Check the backfilled rows once instead of on every insert
+        cursor.execute("PRAGMA foreign_key_check(video_tags)")
+        violations = cursor.fetchall()
+        if violations:
+            raise RuntimeError(f"{len(violations)} video tags reference missing videos")
+
+        # Refresh planner statistics for the new schema
+        cursor.execute("ANALYZE")
+
+        # Commit changes
+        conn.commit()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA optimize")
+        print("\n✓ Migration completed successfully!")
+        return 0
+
+    except Exception as e:
+        print(f"\n✗ Migration failed: {e}")
+        conn.rollback()
+        return 1
+
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    sys.exit(migrate())
@@ -3,10 +3,13 @@
 GREEN phase: Implement database connection to pass tests.
 """
 import os
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, exists, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
-from src.db.models import Base
+from src.db.models import Base, Video, VideoTag
+from src.db.tags import split_tags
 
 
 def get_database_url() -> str:
@@ -31,15 +34,29 @@ engine = create_engine(
 
 # Enable foreign key constraints for SQLite
 # This is necessary for CASCADE deletes to work
+# WAL with synchronous=NORMAL avoids an fsync on every repository commit
+# busy_timeout makes a writer wait for a lock instead of failing at once
+# A larger page cache, memory-mapped reads and in-memory temp tables keep
+# hot pages and sorts off the disk
 if "sqlite" in DATABASE_URL:
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.execute("PRAGMA cache_size=-50000")  # ~50 MB
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
         cursor.close()
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects keep their loaded attributes after commit; sessions are
+# request-scoped, so there is nothing to gain from re-reading them
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 def init_db():
@@ -48,6 +65,41 @@ def init_db():
     This should be called on application startup.
     """
     Base.metadata.create_all(bind=engine)
+    backfill_video_tags(engine)
+
+
+def backfill_video_tags(bind: Engine) -> int:
+    """Fill video_tags for videos whose tags have no rows there yet.
+
+    Databases created before video_tags existed get the table empty from
+    create_all, and a library scan skips videos it already knows, so
+    without this tag filtering would match nothing. Safe to run on every
+    startup: videos that already have tag rows are skipped.
+
+    Args:
+        bind: Engine to run the backfill on
+
+    Returns:
+        Number of tag rows inserted
+    """
+    with bind.begin() as conn:
+        missing = conn.execute(
+            select(Video.id, Video.tags).where(
+                Video.tags.is_not(None),
+                ~exists().where(VideoTag.video_id == Video.id)
+            )
+        ).all()
+        rows = [
+            {"video_id": video_id, "tag": tag}
+            for video_id, tags in missing
+            for tag in split_tags(tags)
+        ]
+        if rows:
+            conn.execute(
+                sqlite_insert(VideoTag).on_conflict_do_nothing(), rows
+            )
+
+    return len(rows)
 
 
 def get_db():
@@ -3,7 +3,7 @@
 GREEN phase: Implement models to pass tests.
 """
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship, declarative_base
 
 
@@ -23,11 +23,34 @@ class Video(Base):
     duration_seconds = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # One row per tag, mirroring the comma-separated tags column
+    tag_rows = relationship("VideoTag", cascade="all, delete-orphan")
+
     def __repr__(self):
         """String representation of Video."""
         return f"<Video(id={self.id}, title='{self.title}', path='{self.path}')>"
 
 
+class VideoTag(Base):
+    """Normalized video tag, so tag filters can use an index."""
+
+    __tablename__ = "video_tags"
+    __table_args__ = (
+        Index("ix_video_tags_tag", "tag"),
+    )
+
+    video_id = Column(
+        Integer,
+        ForeignKey("videos.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    tag = Column(String, primary_key=True)
+
+    def __repr__(self):
+        """String representation of VideoTag."""
+        return f"<VideoTag(video_id={self.video_id}, tag='{self.tag}')>"
+
+
 class ClientSettings(Base):
     """Client settings model representing a device's configuration."""
 
@@ -56,6 +79,10 @@ class PlayLog(Base):
     """Play log model tracking video plays per client."""
 
     __tablename__ = "play_log"
+    __table_args__ = (
+        # Serves the per-client daily play count as an index range scan
+        Index("ix_play_log_client_played_at", "client_id", "played_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     client_id = Column(
@@ -83,6 +110,10 @@ class Queue(Base):
     """Queue model representing videos queued for a client."""
 
     __tablename__ = "queue"
+    __table_args__ = (
+        # Lets a client's queue be read in position order without a sort
+        Index("ix_queue_client_position", "client_id", "position"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     client_id = Column(
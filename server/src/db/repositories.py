@@ -4,20 +4,80 @@ GREEN phase: Implement repositories to pass tests.
 
 Repositories provide a data access layer, separating business logic from database queries.
 """
-import random
 import time as time_module
 import logging
-from datetime import date, datetime, time
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
-
-from src.db.models import Video, ClientSettings, PlayLog
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import Row, case, delete, func, insert, lambda_stmt, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, selectinload
+
+from src.db.models import Video, VideoTag, ClientSettings, PlayLog, Queue
+from src.db.tags import split_tags
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 
+# How long a client settings snapshot may be served without hitting the DB
+SETTINGS_CACHE_TTL_SECONDS = 5.0
+
+# Per-process cache of client_id -> (expires_at, snapshot)
+_settings_cache: Dict[str, Tuple[float, "ClientSettingsSnapshot"]] = {}
+
+# Per-client invalidation counters; a refill is only stored if no write
+# invalidated the client while its SELECT was in flight
+_settings_generations: Dict[str, int] = {}
+_settings_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ClientSettingsSnapshot:
+    """Detached, read-only copy of the settings used for limit checks."""
+
+    client_id: str
+    daily_limit: int
+    tag_filters: Optional[str]
+    bonus_plays_count: int
+    bonus_plays_date: Optional[date]
+
+
+def clear_settings_cache() -> None:
+    """Drop all cached client settings snapshots."""
+    with _settings_lock:
+        _settings_cache.clear()
+
+
+def invalidate_settings(client_id: str) -> None:
+    """Drop a client's cached snapshot and block in-flight refills of it.
+
+    Args:
+        client_id: Client identifier
+    """
+    with _settings_lock:
+        _settings_generations[client_id] = _settings_generations.get(client_id, 0) + 1
+        _settings_cache.pop(client_id, None)
+
+
+@lru_cache(maxsize=16)
+def day_bounds(day: date) -> Tuple[datetime, datetime]:
+    """Get the half-open datetime range covering a calendar day.
+
+    Cached, since every limit check in a request asks for the same day.
+
+    Args:
+        day: Calendar day
+
+    Returns:
+        Tuple of (start of day, start of next day) for ``start <= t < end``
+    """
+    start_of_day = datetime.combine(day, time.min)
+    return start_of_day, start_of_day + timedelta(days=1)
+
+
 class VideoRepository:
     """Repository for Video model operations."""
 
@@ -37,6 +97,23 @@ class VideoRepository:
         """
         return self.db.query(Video).all()
 
+    def list_summary(self) -> List[Row]:
+        """Get the listing columns of all videos, sorted by title.
+
+        Returns plain rows instead of Video objects, so large libraries can be
+        listed without building an ORM instance per video.
+
+        Returns:
+            List of rows with id, path, title, tags, duration_seconds and
+            created_at attributes
+        """
+        return self.db.execute(
+            select(
+                Video.id, Video.path, Video.title, Video.tags,
+                Video.duration_seconds, Video.created_at
+            ).order_by(Video.title, Video.id)
+        ).all()
+
     def get_by_id(self, video_id: int) -> Optional[Video]:
         """Get video by ID.
 
@@ -46,7 +123,8 @@ class VideoRepository:
         Returns:
             Video object or None if not found
         """
-        return self.db.query(Video).filter(Video.id == video_id).first()
+        # Served from the identity map when already loaded in this session
+        return self.db.get(Video, video_id)
 
     def get_by_path(self, path: str) -> Optional[Video]:
         """Get video by file path.
@@ -57,14 +135,18 @@ class VideoRepository:
         Returns:
             Video object or None if not found
         """
-        return self.db.query(Video).filter(Video.path == path).first()
+        # Called once per file during a library scan
+        return self.db.scalars(
+            lambda_stmt(lambda: select(Video).where(Video.path == path))
+        ).first()
 
     def create(
         self,
         path: str,
         title: str,
         tags: Optional[str] = None,
-        duration_seconds: Optional[int] = None
+        duration_seconds: Optional[int] = None,
+        commit: bool = True
     ) -> Video:
         """Create a new video.
 
@@ -73,6 +155,8 @@ class VideoRepository:
             title: Video title
             tags: Comma-separated tags
             duration_seconds: Video duration in seconds
+            commit: Commit immediately; pass False when the caller commits
+                a batch of changes itself
 
         Returns:
             Created Video object
@@ -81,18 +165,21 @@ class VideoRepository:
             path=path,
             title=title,
             tags=tags,
-            duration_seconds=duration_seconds
+            duration_seconds=duration_seconds,
+            tag_rows=[VideoTag(tag=tag) for tag in split_tags(tags)]
         )
         self.db.add(video)
-        self.db.commit()
-        self.db.refresh(video)
+        if commit:
+            self.db.commit()
         return video
 
-    def delete(self, video_id: int) -> bool:
+    def delete(self, video_id: int, commit: bool = True) -> bool:
         """Delete a video by ID.
 
         Args:
             video_id: Video ID to delete
+            commit: Commit immediately; pass False when the caller commits
+                a batch of changes itself
 
         Returns:
             True if video was deleted, False if not found
@@ -102,19 +189,33 @@ class VideoRepository:
             return False
 
         self.db.delete(video)
-        self.db.commit()
+        if commit:
+            self.db.commit()
         return True
 
+    def get_matching_tags(self, tags: List[str]) -> List[Video]:
+        """Get videos that have any of the given tags.
+
+        Args:
+            tags: Tags to match exactly
+
+        Returns:
+            List of matching Video objects
+        """
+        return self.db.query(Video).filter(
+            Video.id.in_(select(VideoTag.video_id).where(VideoTag.tag.in_(tags)))
+        ).all()
+
     def get_random(self) -> Optional[Video]:
         """Get a random video.
 
         Returns:
             Random Video object or None if none exist
         """
-        videos = self.get_all()
-        if not videos:
-            return None
-        return random.choice(videos)
+        # Let SQLite pick the row so only one Video is loaded per request
+        return self.db.scalars(lambda_stmt(
+            lambda: select(Video).order_by(func.random()).limit(1)
+        )).first()
 
 
 class ClientRepository:
@@ -145,9 +246,47 @@ class ClientRepository:
         Returns:
             ClientSettings object or None if not found
         """
-        return self.db.query(ClientSettings).filter(
-            ClientSettings.client_id == client_id
-        ).first()
+        # Served from the identity map when already loaded in this session
+        return self.db.get(ClientSettings, client_id)
+
+    def get_settings_snapshot(self, client_id: str) -> Optional[ClientSettingsSnapshot]:
+        """Get a client's limit settings, cached for a few seconds.
+
+        Settings change rarely but are read on every play decision, so
+        recent lookups are served from a per-process cache. Writes through
+        this repository invalidate the cached entry.
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            ClientSettingsSnapshot or None if the client doesn't exist
+        """
+        now = time_module.monotonic()
+        with _settings_lock:
+            cached = _settings_cache.get(client_id)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            generation = _settings_generations.get(client_id, 0)
+
+        row = self.db.execute(lambda_stmt(
+            lambda: select(
+                ClientSettings.daily_limit,
+                ClientSettings.tag_filters,
+                ClientSettings.bonus_plays_count,
+                ClientSettings.bonus_plays_date
+            ).where(ClientSettings.client_id == client_id)
+        )).first()
+
+        if row is None:
+            return None
+
+        snapshot = ClientSettingsSnapshot(client_id, *row)
+        with _settings_lock:
+            # A write since the SELECT began means this row may be stale
+            if _settings_generations.get(client_id, 0) == generation:
+                _settings_cache[client_id] = (now + SETTINGS_CACHE_TTL_SECONDS, snapshot)
+        return snapshot
 
     def create(
         self,
@@ -175,7 +314,7 @@ class ClientRepository:
         )
         self.db.add(client)
         self.db.commit()
-        self.db.refresh(client)
+        invalidate_settings(client_id)
         return client
 
     def get_or_create(
@@ -202,11 +341,22 @@ class ClientRepository:
         if friendly_name is None:
             friendly_name = f"Client {client_id}"
 
-        return self.create(
-            client_id=client_id,
-            friendly_name=friendly_name,
-            daily_limit=daily_limit
-        )
+        # INSERT ... ON CONFLICT DO NOTHING RETURNING, so a concurrent request
+        # creating the same client can't make this one fail
+        client = self.db.scalars(
+            sqlite_insert(ClientSettings).values(
+                client_id=client_id,
+                friendly_name=friendly_name,
+                daily_limit=daily_limit
+            ).on_conflict_do_nothing(
+                index_elements=[ClientSettings.client_id]
+            ).returning(ClientSettings)
+        ).first()
+        self.db.commit()
+        invalidate_settings(client_id)
+
+        # Nothing returned means another request inserted it first
+        return client if client is not None else self.get_by_id(client_id)
 
     def update(
         self,
@@ -226,20 +376,18 @@ class ClientRepository:
         Returns:
             Updated ClientSettings object or None if not found
         """
-        client = self.get_by_id(client_id)
-        if not client:
-            return None
-
+        values = {}
         if friendly_name is not None:
-            client.friendly_name = friendly_name
+            values["friendly_name"] = friendly_name
         if daily_limit is not None:
-            client.daily_limit = daily_limit
+            values["daily_limit"] = daily_limit
         if tag_filters is not None:
-            client.tag_filters = tag_filters
+            values["tag_filters"] = tag_filters
 
-        self.db.commit()
-        self.db.refresh(client)
-        return client
+        if not values:
+            return self.get_by_id(client_id)
+
+        return self._update_returning(client_id, values)
 
     def add_bonus_plays(
         self,
@@ -257,20 +405,39 @@ class ClientRepository:
         Returns:
             Updated ClientSettings object or None if not found
         """
-        client = self.get_by_id(client_id)
-        if not client:
-            return None
+        # If bonus plays are for the same date, add to existing bonus;
+        # a new date replaces them. Done in SQL so concurrent adds can't
+        # overwrite each other.
+        return self._update_returning(client_id, {
+            "bonus_plays_count": case(
+                (ClientSettings.bonus_plays_date == bonus_date,
+                 ClientSettings.bonus_plays_count + bonus_count),
+                else_=bonus_count
+            ),
+            "bonus_plays_date": bonus_date,
+        })
+
+    def _update_returning(
+        self,
+        client_id: str,
+        values: Dict[str, Any]
+    ) -> Optional[ClientSettings]:
+        """Apply an UPDATE to one client and return the updated row.
 
-        # If bonus plays are for the same date, add to existing bonus
-        if client.bonus_plays_date == bonus_date:
-            client.bonus_plays_count += bonus_count
-        else:
-            # New date - replace existing bonus plays
-            client.bonus_plays_count = bonus_count
-            client.bonus_plays_date = bonus_date
+        Args:
+            client_id: Client identifier
+            values: Column values or SQL expressions to set
 
+        Returns:
+            Updated ClientSettings object or None if not found
+        """
+        client = self.db.scalars(
+            update(ClientSettings).where(
+                ClientSettings.client_id == client_id
+            ).values(**values).returning(ClientSettings)
+        ).first()
         self.db.commit()
-        self.db.refresh(client)
+        invalidate_settings(client_id)
         return client
 
 
@@ -308,95 +475,62 @@ class PlayLogRepository:
         )
         self.db.add(play)
         self.db.commit()
-        self.db.refresh(play)
         return play
 
+    def log_plays_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert many plays with one executemany and a single commit.
+
+        Intended for backfills and seeding play history; unset columns
+        (played_at, completed) get their usual defaults.
+
+        Args:
+            rows: PlayLog column values, one dict per play
+        """
+        if not rows:
+            return
+
+        self.db.execute(insert(PlayLog), rows)
+        self.db.commit()
+
     def log_play_safe(
         self,
         client_id: str,
         video_id: int,
-        completed: bool = False,
-        max_retries: int = 3
+        completed: bool = False
     ) -> Optional[PlayLog]:
-        """Log a video play with retry logic and error handling.
+        """Log a video play without raising on failure.
 
-        This method is designed to be robust and non-blocking. If logging fails
-        after all retries, it logs the error but returns None without raising
-        an exception, allowing the calling code to continue.
+        Lock contention is handled by SQLite's busy_timeout (set on every
+        connection), so a failure here is not worth retrying. The error is
+        logged and None is returned, allowing the calling code to continue.
 
         Args:
             client_id: Client identifier
             video_id: Video ID
             completed: Whether the video was completed
-            max_retries: Maximum number of retry attempts (default: 3)
 
         Returns:
-            Created PlayLog object if successful, None if all retries failed
+            Created PlayLog object if successful, None if logging failed
         """
-        last_error = None
-
-        for attempt in range(max_retries):
+        try:
+            return self.log_play(
+                client_id=client_id,
+                video_id=video_id,
+                completed=completed
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to log play for client={client_id}, video={video_id}: {e}",
+                exc_info=True
+            )
+
+            # Rollback the transaction to clean up
             try:
-                # Attempt to log the play
-                play = self.log_play(
-                    client_id=client_id,
-                    video_id=video_id,
-                    completed=completed
-                )
+                self.db.rollback()
+            except Exception as rollback_error:
+                logger.error(f"Failed to rollback transaction: {rollback_error}")
 
-                # Success! Log and return
-                if attempt > 0:
-                    logger.info(
-                        f"Play logged successfully on attempt {attempt + 1}/{max_retries} "
-                        f"for client={client_id}, video={video_id}"
-                    )
-                return play
-
-            except SQLAlchemyError as e:
-                last_error = e
-                logger.warning(
-                    f"Failed to log play on attempt {attempt + 1}/{max_retries} "
-                    f"for client={client_id}, video={video_id}: {str(e)}"
-                )
-
-                # Rollback the transaction to clean up
-                try:
-                    self.db.rollback()
-                except Exception as rollback_error:
-                    logger.error(f"Failed to rollback transaction: {rollback_error}")
-
-                # Don't sleep on the last attempt
-                if attempt < max_retries - 1:
-                    # Exponential backoff: 0.1s, 0.2s, 0.4s, etc.
-                    sleep_time = 0.1 * (2 ** attempt)
-                    logger.debug(f"Waiting {sleep_time}s before retry...")
-                    time_module.sleep(sleep_time)
-
-            except Exception as e:
-                # Catch any other unexpected exceptions
-                last_error = e
-                logger.error(
-                    f"Unexpected error logging play on attempt {attempt + 1}/{max_retries} "
-                    f"for client={client_id}, video={video_id}: {str(e)}",
-                    exc_info=True
-                )
-
-                # Try to rollback
-                try:
-                    self.db.rollback()
-                except Exception:
-                    pass
-
-                # For unexpected errors, don't retry
-                break
-
-        # All retries failed
-        logger.error(
-            f"Failed to log play after {max_retries} attempts "
-            f"for client={client_id}, video={video_id}. Last error: {last_error}",
-            exc_info=True
-        )
-        return None
+            return None
 
     def count_plays_today(self, client_id: str, today: date) -> int:
         """Count all plays for a client today.
@@ -408,29 +542,69 @@ class PlayLogRepository:
         Returns:
             Number of plays today
         """
-        start_of_day = datetime.combine(today, time.min)
-        end_of_day = datetime.combine(today, time.max)
+        start_of_day, start_of_next_day = day_bounds(today)
+
+        # Flat SELECT count(*) ... WHERE, not ORM count()'s wrapping subquery
+        return self.db.execute(
+            select(func.count()).select_from(PlayLog).where(
+                PlayLog.client_id == client_id,
+                PlayLog.played_at >= start_of_day,
+                PlayLog.played_at < start_of_next_day
+            )
+        ).scalar_one()
+
+    def get_play_counts(self, client_id: str, today: date) -> Tuple[int, int]:
+        """Count a client's all-time and today's plays in a single query.
+
+        Args:
+            client_id: Client identifier
+            today: Date to count today's plays for
+
+        Returns:
+            Tuple of (total plays, plays today)
+        """
+        start_of_day, start_of_next_day = day_bounds(today)
+        is_today = (PlayLog.played_at >= start_of_day) & (PlayLog.played_at < start_of_next_day)
 
-        return self.db.query(PlayLog).filter(
-            PlayLog.client_id == client_id,
-            PlayLog.played_at >= start_of_day,
-            PlayLog.played_at <= end_of_day
-        ).count()
+        total, plays_today = self.db.query(
+            func.count(PlayLog.id),
+            func.coalesce(func.sum(case((is_today, 1), else_=0)), 0)
+        ).filter(PlayLog.client_id == client_id).one()
 
+        return total, plays_today
 
-    def get_recent_plays(self, client_id: str, limit: int = 10) -> List[PlayLog]:
+    def get_recent_plays(
+        self,
+        client_id: str,
+        limit: int = 10,
+        before: Optional[datetime] = None
+    ) -> List[PlayLog]:
         """Get recent plays for a client.
 
+        Pass the played_at of the last play on one page as ``before`` to get
+        the next page. This seeks along the (client_id, played_at) index
+        instead of skipping rows with OFFSET.
+
         Args:
             client_id: Client identifier
             limit: Maximum number of plays to return
+            before: Only return plays strictly older than this time
 
         Returns:
-            List of recent PlayLog objects (most recent first)
+            List of recent PlayLog objects (most recent first), with their
+            videos loaded
         """
-        return self.db.query(PlayLog).filter(
-            PlayLog.client_id == client_id
-        ).order_by(PlayLog.played_at.desc()).limit(limit).all()
+        # Load the played videos in one extra query instead of one per play
+        stmt = lambda_stmt(
+            lambda: select(PlayLog).where(
+                PlayLog.client_id == client_id
+            ).options(selectinload(PlayLog.video))
+        )
+        if before is not None:
+            stmt += lambda s: s.where(PlayLog.played_at < before)
+        stmt += lambda s: s.order_by(PlayLog.played_at.desc()).limit(limit)
+
+        return self.db.scalars(stmt).all()
 
 
 class QueueRepository:
@@ -444,27 +618,28 @@ class QueueRepository:
         """
         self.db = db
 
-    def get_by_client(self, client_id: str) -> List['Queue']:
+    def get_by_client(self, client_id: str) -> List[Queue]:
         """Get all queue items for a client, sorted by position.
 
         Args:
             client_id: Client identifier
 
         Returns:
-            List of Queue objects sorted by position
+            List of Queue objects sorted by position, with their videos loaded
         """
-        from src.db.models import Queue
-
-        return self.db.query(Queue).filter(
-            Queue.client_id == client_id
-        ).order_by(Queue.position).all()
+        # Load the queued videos in one extra query instead of one per item
+        return self.db.scalars(lambda_stmt(
+            lambda: select(Queue).where(
+                Queue.client_id == client_id
+            ).options(selectinload(Queue.video)).order_by(Queue.position)
+        )).all()
 
     def add(
         self,
         client_id: str,
         video_id: int,
         position: Optional[int] = None
-    ) -> 'Queue':
+    ) -> Queue:
         """Add a video to client's queue.
 
         Args:
@@ -475,14 +650,14 @@ class QueueRepository:
         Returns:
             Created Queue object
         """
-        from src.db.models import Queue
-
-        # If position not provided, add to end of queue
+        # If position not provided, add after the current last position,
+        # computed by a subselect inside the INSERT itself
         if position is None:
-            max_pos = self.db.query(Queue).filter(
+            position = select(
+                func.coalesce(func.max(Queue.position), 0) + 1
+            ).where(
                 Queue.client_id == client_id
-            ).count()
-            position = max_pos + 1
+            ).scalar_subquery()
 
         queue_item = Queue(
             client_id=client_id,
@@ -491,10 +666,9 @@ class QueueRepository:
         )
         self.db.add(queue_item)
         self.db.commit()
-        self.db.refresh(queue_item)
         return queue_item
 
-    def get_next(self, client_id: str) -> Optional['Queue']:
+    def get_next(self, client_id: str) -> Optional[Queue]:
         """Get the next video in queue (first item by position).
 
         Args:
@@ -503,11 +677,11 @@ class QueueRepository:
         Returns:
             Queue object or None if queue is empty
         """
-        from src.db.models import Queue
-
-        return self.db.query(Queue).filter(
-            Queue.client_id == client_id
-        ).order_by(Queue.position).first()
+        return self.db.scalars(lambda_stmt(
+            lambda: select(Queue).where(
+                Queue.client_id == client_id
+            ).order_by(Queue.position).limit(1)
+        )).first()
 
     def remove(self, queue_id: int) -> None:
         """Remove a queue item by ID.
@@ -515,8 +689,6 @@ class QueueRepository:
         Args:
             queue_id: Queue item ID to remove
         """
-        from src.db.models import Queue
-
         queue_item = self.db.query(Queue).filter(
             Queue.id == queue_id
         ).first()
@@ -531,8 +703,6 @@ class QueueRepository:
         Args:
             client_id: Client identifier
         """
-        from src.db.models import Queue
-
         self.db.query(Queue).filter(
             Queue.client_id == client_id
         ).delete()
@@ -545,21 +715,23 @@ class QueueRepository:
             client_id: Client identifier
             queue_ids: List of queue item IDs in new order
         """
-        from src.db.models import Queue
-
-        # Update position for each item
-        for new_position, queue_id in enumerate(queue_ids, start=1):
-            queue_item = self.db.query(Queue).filter(
-                Queue.id == queue_id,
-                Queue.client_id == client_id
-            ).first()
-
-            if queue_item:
-                queue_item.position = new_position
+        if not queue_ids:
+            return
+
+        # Set every position in one UPDATE ... SET position = CASE id ... END
+        new_positions = {
+            queue_id: new_position
+            for new_position, queue_id in enumerate(queue_ids, start=1)
+        }
+        self.db.execute(
+            update(Queue)
+            .where(Queue.client_id == client_id, Queue.id.in_(new_positions))
+            .values(position=case(new_positions, value=Queue.id))
+        )
 
         self.db.commit()
 
-    def pop(self, client_id: str) -> Optional['Queue']:
+    def pop(self, client_id: str) -> Optional[Queue]:
         """Remove and return the first item in queue.
 
         Args:
@@ -568,7 +740,22 @@ class QueueRepository:
         Returns:
             Removed Queue object or None if queue is empty
         """
-        from src.db.models import Queue
+        # SQLite 3.35+ can delete and return the row in one statement
+        if self.db.get_bind().dialect.delete_returning:
+            first_id = select(Queue.id).where(
+                Queue.client_id == client_id
+            ).order_by(Queue.position).limit(1).scalar_subquery()
+
+            row = self.db.execute(
+                delete(Queue).where(Queue.id == first_id).returning(
+                    Queue.id, Queue.client_id, Queue.video_id,
+                    Queue.position, Queue.created_at
+                )
+            ).first()
+            self.db.commit()
+
+            # The row is gone, so hand back a detached copy of it
+            return Queue(**row._mapping) if row else None
 
         # Get first item
         queue_item = self.db.query(Queue).filter(
@@ -593,8 +780,8 @@ class QueueRepository:
         Returns:
             Number of queue items
         """
-        from src.db.models import Queue
-
-        return self.db.query(Queue).filter(
-            Queue.client_id == client_id
-        ).count()
+        return self.db.execute(
+            select(func.count()).select_from(Queue).where(
+                Queue.client_id == client_id
+            )
+        ).scalar_one()
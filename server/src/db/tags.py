@@ -0,0 +1,16 @@
+"""Tag string helpers shared by the repositories, startup backfill and migrations."""
+from typing import List, Optional
+
+
+def split_tags(tags: Optional[str]) -> List[str]:
+    """Split a comma-separated tag string into unique, trimmed tags.
+
+    Args:
+        tags: Comma-separated tags (may be None)
+
+    Returns:
+        List of tags in their original order
+    """
+    if not tags:
+        return []
+    return list(dict.fromkeys(tag.strip() for tag in tags.split(",") if tag.strip()))
@@ -10,10 +10,15 @@ from fastapi import FastAPI, Query, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, ConfigDict
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from src.db.database import get_db, init_db
-from src.db.repositories import VideoRepository, ClientRepository, PlayLogRepository, QueueRepository
+from src.db.repositories import (
+    VideoRepository, ClientRepository, PlayLogRepository, QueueRepository,
+    day_bounds
+)
+from src.db.tags import split_tags
 from src.services.limit_service import LimitService
 
 
@@ -250,26 +255,24 @@ def get_next_video(
     limit_service = LimitService(db)
     queue_repo = QueueRepository(db)
 
-    # Get or create client
-    client = client_repo.get_or_create(
-        client_id=client_id,
-        friendly_name=f"Client {client_id}"
-    )
+    # Register unknown clients; known ones are answered from the
+    # short-lived settings cache without touching the database
+    if client_repo.get_settings_snapshot(client_id) is None:
+        client_repo.get_or_create(
+            client_id=client_id,
+            friendly_name=f"Client {client_id}"
+        )
 
-    # PHASE 3: Check queue first
-    queue_item = queue_repo.get_next(client_id)
+    # PHASE 3: Check queue first. pop() takes the item off the queue in one
+    # statement, so two concurrent requests can't both serve it
+    queue_item = queue_repo.pop(client_id)
 
     if queue_item:
         # Queue has items - serve from queue (bypasses limit)
         video = video_repo.get_by_id(queue_item.video_id)
 
-        if video is None:
-            # Video in queue doesn't exist - remove queue item and fallback
-            queue_repo.remove(queue_item.id)
-        else:
-            # Remove from queue and serve
-            queue_repo.remove(queue_item.id)
-
+        # A queued video that no longer exists falls back to the limit logic
+        if video is not None:
             # Log the play (non-blocking - video will be served even if logging fails)
             play_log_repo.log_play_safe(
                 client_id=client_id,
@@ -419,11 +422,6 @@ def update_client(
     """
     client_repo = ClientRepository(db)
 
-    # Check if client exists
-    existing_client = client_repo.get_by_id(client_id)
-    if existing_client is None:
-        raise HTTPException(status_code=404, detail=f"Client '{client_id}' not found")
-
     # Build update dict with only provided fields
     update_data = {}
     if client_data.friendly_name is not None:
@@ -433,8 +431,10 @@ def update_client(
     if client_data.tag_filters is not None:
         update_data["tag_filters"] = client_data.tag_filters
 
-    # Update client
+    # Update client; None means no row matched
     updated_client = client_repo.update(client_id, **update_data)
+    if updated_client is None:
+        raise HTTPException(status_code=404, detail=f"Client '{client_id}' not found")
 
     return updated_client
 
@@ -463,18 +463,15 @@ def add_bonus_plays(
     client_repo = ClientRepository(db)
     limit_service = LimitService(db)
 
-    # Check if client exists
-    client = client_repo.get_by_id(client_id)
-    if client is None:
-        raise HTTPException(status_code=404, detail=f"Client '{client_id}' not found")
-
-    # Add bonus plays for today
+    # Add bonus plays for today; None means no row matched
     today = date.today()
     updated_client = client_repo.add_bonus_plays(
         client_id=client_id,
         bonus_count=bonus_data.count,
         bonus_date=today
     )
+    if updated_client is None:
+        raise HTTPException(status_code=404, detail=f"Client '{client_id}' not found")
 
     # Get effective limit with bonus
     effective_limit = limit_service.get_effective_daily_limit(client_id, today)
@@ -496,7 +493,7 @@ def get_videos(
     """Get all videos from database.
 
     Args:
-        tags: Optional filter for videos with specific tags
+        tags: Optional comma-separated tags; videos with any of them are returned
         db: Database session
 
     Returns:
@@ -504,12 +501,12 @@ def get_videos(
     """
     video_repo = VideoRepository(db)
 
-    # Get all videos
-    videos = video_repo.get_all()
+    # Without a filter, list plain rows already sorted by title
+    if tags is None:
+        return video_repo.list_summary()
 
-    # Apply filters if provided
-    if tags is not None:
-        videos = [v for v in videos if v.tags and tags in v.tags]
+    # Filter through the indexed video_tags table
+    videos = video_repo.get_matching_tags(split_tags(tags))
 
     # Sort by title for consistent ordering
     return sorted(videos, key=lambda v: v.title)
@@ -536,7 +533,8 @@ def scan_videos(db: Session = Depends(get_db)):
         all_videos = video_repo.get_all()
         removed = len(all_videos)
         for video in all_videos:
-            video_repo.delete(video.id)
+            video_repo.delete(video.id, commit=False)
+        db.commit()
         return ScanResponse(added=0, skipped=0, removed=removed, total_found=0)
 
     # Scan for videos
@@ -566,7 +564,8 @@ def scan_videos(db: Session = Depends(get_db)):
         video_repo.create(
             path=video_path,
             title=title,
-            tags=tags
+            tags=tags,
+            commit=False
         )
         added += 1
 
@@ -577,9 +576,12 @@ def scan_videos(db: Session = Depends(get_db)):
     for video in all_videos:
         if video.path not in video_paths_set:
             # Video no longer exists in library - remove it
-            video_repo.delete(video.id)
+            video_repo.delete(video.id, commit=False)
             removed += 1
 
+    # One commit for the whole scan instead of one per added/removed video
+    db.commit()
+
     return ScanResponse(
         added=added,
         skipped=skipped,
@@ -776,13 +778,14 @@ def reorder_queue(
     from src.db.models import Queue
 
     # Verify all queue items exist and belong to client
+    found_ids = {
+        queue_id for (queue_id,) in db.query(Queue.id).filter(
+            Queue.client_id == client_id,
+            Queue.id.in_(request.queue_ids)
+        )
+    }
     for queue_id in request.queue_ids:
-        queue_item = db.query(Queue).filter(
-            Queue.id == queue_id,
-            Queue.client_id == client_id
-        ).first()
-
-        if queue_item is None:
+        if queue_id not in found_ids:
             raise HTTPException(
                 status_code=404,
                 detail=f"Queue item {queue_id} not found for client {client_id}"
@@ -815,18 +818,19 @@ def get_system_stats(db: Session = Depends(get_db)):
 
     # Count plays
     from src.db.models import PlayLog
-    total_plays = db.query(PlayLog).count()
+    total_plays = db.execute(
+        select(func.count()).select_from(PlayLog)
+    ).scalar_one()
 
     # Count today's plays
-    from datetime import datetime, time
-    today = date.today()
-    start_of_day = datetime.combine(today, time.min)
-    end_of_day = datetime.combine(today, time.max)
+    start_of_day, start_of_next_day = day_bounds(date.today())
 
-    plays_today = db.query(PlayLog).filter(
-        PlayLog.played_at >= start_of_day,
-        PlayLog.played_at <= end_of_day
-    ).count()
+    plays_today = db.execute(
+        select(func.count()).select_from(PlayLog).where(
+            PlayLog.played_at >= start_of_day,
+            PlayLog.played_at < start_of_next_day
+        )
+    ).scalar_one()
 
     return SystemStatsResponse(
         total_videos=len(all_videos),
@@ -858,17 +862,11 @@ def get_client_stats(client_id: str, db: Session = Depends(get_db)):
     if client is None:
         raise HTTPException(status_code=404, detail=f"Client {client_id} not found")
 
-    # Get play counts
+    # Get play counts (today and all time)
     today = date.today()
-    plays_today = play_log_repo.count_plays_today(client_id, today)
+    total_plays, plays_today = play_log_repo.get_play_counts(client_id, today)
     plays_remaining = max(0, client.daily_limit - plays_today)
 
-    # Get total plays (all time)
-    from src.db.models import PlayLog
-    total_plays = db.query(PlayLog).filter(
-        PlayLog.client_id == client_id
-    ).count()
-
     # Get queue size
     queue_size = queue_repo.count(client_id)
 
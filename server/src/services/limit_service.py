@@ -52,7 +52,7 @@ class LimitService:
         Returns:
             Daily video limit (default if client doesn't exist)
         """
-        client = self.client_repo.get_by_id(client_id)
+        client = self.client_repo.get_settings_snapshot(client_id)
 
         if client is None:
             return DEFAULT_DAILY_LIMIT
@@ -69,7 +69,7 @@ class LimitService:
         Returns:
             Effective daily video limit (base limit + bonus plays if applicable)
         """
-        client = self.client_repo.get_by_id(client_id)
+        client = self.client_repo.get_settings_snapshot(client_id)
 
         if client is None:
             return DEFAULT_DAILY_LIMIT
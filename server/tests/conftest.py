@@ -2,12 +2,31 @@
 
 Provides common setup like test client, mock data, etc.
 """
+import os
+
 import pytest
 from pathlib import Path
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+# Point the application's default engine at an in-memory database before
+# src.db.database is imported, so tests never create or fsync an on-disk
+# bobavision.db. It is named so it stays separate from db_session's database.
+os.environ.setdefault(
+    "DATABASE_URL", "sqlite:///file:bobavision_test?mode=memory&cache=shared&uri=true"
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_client_settings_cache():
+    """Keep cached client settings from leaking between tests' databases."""
+    from src.db.repositories import clear_settings_cache
+
+    clear_settings_cache()
+    yield
+    clear_settings_cache()
+
 
 @pytest.fixture
 def sample_videos(tmp_path):
@@ -145,6 +145,23 @@ def test_api_next_respects_custom_client_limit(client_with_db, db_session, setup
     assert response2.json()["placeholder"] is True   # Second is HTML animation
 
 
+def test_api_next_sees_raised_limit_immediately(client_with_db, db_session, setup_videos):
+    """Test that updating a client's limit bypasses the cached settings."""
+    # Arrange - Reach the limit of 1 so the client's settings are cached
+    client_with_db.post("/api/clients", json={
+        "client_id": "limited", "friendly_name": "Limited", "daily_limit": 1
+    })
+    client_with_db.get("/api/next?client_id=limited")
+    assert client_with_db.get("/api/next?client_id=limited").json()["placeholder"] is True
+
+    # Act
+    client_with_db.patch("/api/clients/limited", json={"daily_limit": 2})
+    response = client_with_db.get("/api/next?client_id=limited")
+
+    # Assert
+    assert response.json()["placeholder"] is False
+
+
 def test_api_next_enforces_limit_for_all_plays(client_with_db, db_session, setup_videos):
     """Test that all plays count toward limit."""
     from src.db.repositories import ClientRepository
@@ -333,6 +350,60 @@ def test_api_next_removes_video_from_queue_after_serving(client_with_db, db_sess
     assert len(queue) == 0
 
 
+def test_api_next_pops_queue_item_in_one_statement(client_with_db, db_session, setup_videos):
+    """Test that /api/next takes the queue item with a single DELETE, not SELECT then DELETE."""
+    from sqlalchemy import event
+    from src.db.repositories import QueueRepository, ClientRepository
+
+    # Arrange
+    ClientRepository(db_session).create(client_id="test_client", friendly_name="Test", daily_limit=3)
+    QueueRepository(db_session).add(client_id="test_client", video_id=setup_videos[0].id)
+
+    queue_statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "queue" in statement:
+            queue_statements.append(statement.split()[0].upper())
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+
+    # Act
+    try:
+        response = client_with_db.get("/api/next?client_id=test_client")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    # Assert
+    assert response.json()["title"] == setup_videos[0].title
+    assert queue_statements == ["DELETE"]
+
+
+def test_api_next_falls_back_when_queued_video_is_missing(client_with_db, db_session, setup_videos):
+    """Test that a queued video that no longer exists is dropped and the limit logic is used."""
+    from sqlalchemy import text
+    from src.db.repositories import QueueRepository, ClientRepository, PlayLogRepository
+
+    # Arrange - Queue a video id that doesn't exist, bypassing the foreign key
+    ClientRepository(db_session).create(client_id="test_client", friendly_name="Test", daily_limit=0)
+    db_session.execute(text("PRAGMA foreign_keys=OFF"))
+    db_session.execute(text(
+        "INSERT INTO queue (client_id, video_id, position, created_at) "
+        "VALUES ('test_client', 99999, 1, CURRENT_TIMESTAMP)"
+    ))
+    db_session.commit()
+    db_session.execute(text("PRAGMA foreign_keys=ON"))
+
+    # Act
+    response = client_with_db.get("/api/next?client_id=test_client")
+
+    # Assert - The limit of 0 is enforced and the stale item is gone
+    assert response.status_code == 200
+    assert response.json()["placeholder"] is True
+    assert QueueRepository(db_session).get_by_client("test_client") == []
+    assert PlayLogRepository(db_session).get_recent_plays("test_client", limit=10) == []
+
+
 def test_api_next_returns_queued_videos_in_order(client_with_db, db_session, setup_videos):
     """Test that queued videos are returned in the correct order."""
     from src.db.repositories import QueueRepository, ClientRepository
@@ -514,3 +585,27 @@ def test_api_next_enforces_limit_strictly(client_with_db, db_session):
     from datetime import date
     count = play_repo.count_plays_today("test", date.today())
     assert count == 3, f"Expected 3 plays, got {count}"
+
+
+def test_api_videos_tag_filter_matches_any_exact_tag(client_with_db, db_session):
+    """Test that /api/videos?tags= returns videos with any of the exact tags, by title."""
+    from src.db.repositories import VideoRepository
+
+    # Arrange
+    repo = VideoRepository(db_session)
+    repo.create(path="c.mp4", title="Zebra Cartoon", tags="cartoons")
+    repo.create(path="b.mp4", title="Bedtime Story", tags="bedtime,calm")
+    repo.create(path="e.mp4", title="Alphabet Song", tags="educational,cartoons")
+    repo.create(path="m.mp4", title="Music Time", tags="music")
+
+    # Act
+    union = client_with_db.get("/api/videos?tags=cartoons, bedtime")
+    partial = client_with_db.get("/api/videos?tags=cart")
+
+    # Assert
+    assert union.status_code == 200
+    assert [v["title"] for v in union.json()] == [
+        "Alphabet Song", "Bedtime Story", "Zebra Cartoon"
+    ]
+    assert partial.status_code == 200
+    assert partial.json() == []
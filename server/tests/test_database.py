@@ -6,7 +6,7 @@ Following TDD principles:
 - REFACTOR: Improve code while keeping tests green
 """
 import pytest
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import Session
 
 
@@ -54,6 +54,36 @@ def test_session_factory_creates_sessions():
     session.close()
 
 
+def test_session_factory_keeps_attributes_after_commit():
+    """Test that reading a committed object's attributes issues no SELECT."""
+    from sqlalchemy import event
+    from src.db.database import SessionLocal, engine, Base
+    from src.db.repositories import ClientRepository
+
+    # Arrange
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    client = ClientRepository(session).create(
+        client_id="expire-on-commit", friendly_name="Kitchen", daily_limit=4
+    )
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+
+    # Act
+    try:
+        values = (client.client_id, client.friendly_name, client.daily_limit)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+        session.delete(client)
+        session.commit()
+        session.close()
+
+    # Assert
+    assert values == ("expire-on-commit", "Kitchen", 4)
+    assert statements == []
+
+
 def test_get_db_dependency_yields_session():
     """Test that get_db() dependency function yields a session."""
     from src.db.database import get_db
@@ -124,3 +154,79 @@ def test_database_url_is_configurable():
     assert isinstance(url, str)
     # Default should be SQLite
     assert "sqlite" in url.lower()
+
+
+def test_play_log_has_client_played_at_index():
+    """Test that play_log is indexed for per-client daily counts."""
+    from src.db.database import init_db, engine
+
+    # Act
+    init_db()
+
+    # Assert
+    indexes = {ix["name"]: ix["column_names"] for ix in inspect(engine).get_indexes("play_log")}
+    assert indexes["ix_play_log_client_played_at"] == ["client_id", "played_at"]
+
+
+def test_engine_connections_use_memory_pragmas():
+    """Test that new connections get the page cache and temp store settings."""
+    from src.db.database import engine
+
+    # Act
+    with engine.connect() as conn:
+        cache_size = conn.execute(text("PRAGMA cache_size")).scalar()
+        temp_store = conn.execute(text("PRAGMA temp_store")).scalar()
+
+    # Assert
+    assert cache_size == -50000
+    assert temp_store == 2  # MEMORY
+
+
+def test_engine_connections_enforce_foreign_keys():
+    """Test that every connection has foreign key enforcement turned on."""
+    from src.db.database import engine
+
+    # Act
+    with engine.connect() as conn:
+        foreign_keys = conn.execute(text("PRAGMA foreign_keys")).scalar()
+
+    # Assert
+    assert foreign_keys == 1
+
+
+def test_engine_connections_wait_for_locks():
+    """Test that connections wait on a locked database instead of failing."""
+    from src.db.database import engine
+
+    # Act
+    with engine.connect() as conn:
+        busy_timeout = conn.execute(text("PRAGMA busy_timeout")).scalar()
+
+    # Assert
+    assert busy_timeout == 5000
+
+
+def test_backfill_video_tags_fills_missing_rows_once():
+    """Test that tags of videos from before video_tags are copied over once."""
+    from src.db.database import Base, backfill_video_tags
+    from src.db.models import Video, VideoTag
+
+    # Arrange - videos written without tag rows, as an old database has them
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(Video.__table__.insert(), [
+            {"path": "a.mp4", "title": "A", "tags": "cartoons, animals"},
+            {"path": "b.mp4", "title": "B", "tags": None},
+        ])
+
+    # Act
+    inserted = backfill_video_tags(engine)
+    inserted_again = backfill_video_tags(engine)
+
+    # Assert
+    with Session(engine) as session:
+        tags = sorted(row.tag for row in session.query(VideoTag).all())
+    assert inserted == 2
+    assert inserted_again == 0
+    assert tags == ["animals", "cartoons"]
@@ -13,7 +13,31 @@ import pytest
 import httpx
 
 
+SERVER_URL = "http://localhost:8001"
+
+
 # Test fixtures and helpers
+def wait_for_server(client, path="/", timeout=15.0):
+    """Poll the server until it answers or the timeout expires.
+
+    Args:
+        client: httpx.Client pointed at the server
+        path: Path to request
+        timeout: Seconds to keep trying
+
+    Returns:
+        bool: True if the server answered, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            client.get(path, timeout=0.25)
+            return True
+        except httpx.HTTPError:
+            time.sleep(0.05)
+    return False
+
+
 @pytest.fixture(scope="module")
 def project_root():
     """Get the project root directory."""
@@ -45,8 +69,15 @@ def docker_image_built(project_root):
     subprocess.run(["docker", "rmi", "bobavision-server:test"], capture_output=True)
 
 
+@pytest.fixture(scope="module")
+def http():
+    """Pooled HTTP client for the container, shared by the whole module."""
+    with httpx.Client(base_url=SERVER_URL, timeout=5.0) as client:
+        yield client
+
+
 @pytest.fixture
-def running_container(docker_image_built):
+def running_container(docker_image_built, http):
     """Start a container for testing and clean up after."""
     # Start container
     result = subprocess.run(
@@ -66,8 +97,9 @@ def running_container(docker_image_built):
 
     container_id = result.stdout.strip()
 
-    # Wait for container to be ready
-    time.sleep(2)
+    # Wait for the server inside the container to accept requests. Tests
+    # that only inspect the container still run if it never comes up.
+    wait_for_server(http)
 
     yield container_id
 
@@ -191,13 +223,10 @@ class TestContainerRuntime:
         assert result.returncode == 0, "Container inspect should succeed"
         assert result.stdout.strip() == "true", "Container should be running"
 
-    def test_server_responds(self, running_container):
+    def test_server_responds(self, running_container, http):
         """Test that FastAPI server responds to HTTP requests."""
-        # Wait a bit more for server to fully start
-        time.sleep(3)
-
         try:
-            response = httpx.get("http://localhost:8001/", timeout=5.0)
+            response = http.get("/")
             assert response.status_code == 200, "Server should respond with 200 OK"
 
             data = response.json()
@@ -206,12 +235,10 @@ class TestContainerRuntime:
         except httpx.ConnectError:
             pytest.fail("Server did not respond - container may not have started correctly")
 
-    def test_api_next_endpoint(self, running_container):
+    def test_api_next_endpoint(self, running_container, http):
         """Test that /api/next endpoint is accessible."""
-        time.sleep(3)  # Wait for server
-
         try:
-            response = httpx.get("http://localhost:8001/api/next?client_id=test", timeout=5.0)
+            response = http.get("/api/next", params={"client_id": "test"})
             # Should get 200 OK (even if no videos, it should return something)
             assert response.status_code == 200, "/api/next should be accessible"
 
@@ -241,11 +268,10 @@ class TestContainerRuntime:
 class TestContainerPersistence:
     """Test that data persists correctly with volumes."""
 
-    def test_database_file_created(self, running_container):
+    def test_database_file_created(self, running_container, http):
         """Test that SQLite database file is created in container."""
         # Trigger database initialization by making a request
-        time.sleep(3)
-        httpx.get("http://localhost:8001/api/clients", timeout=5.0)
+        http.get("/api/clients")
 
         # Check if database file exists in container
         result = subprocess.run(
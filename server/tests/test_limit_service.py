@@ -101,8 +101,9 @@ def test_limit_service_is_limit_reached_true_at_exact_limit(setup_client):
     today = date.today()
 
     # Log 3 plays (exactly at limit)
-    for i in range(3):
-        play_repo.log_play("test_client", videos[i % 2].id)
+    play_repo.log_plays_bulk([
+        {"client_id": "test_client", "video_id": videos[i % 2].id} for i in range(3)
+    ])
 
     # Act
     is_reached = service.is_limit_reached("test_client", today)
@@ -125,8 +126,9 @@ def test_limit_service_is_limit_reached_true_beyond_limit(setup_client):
     today = date.today()
 
     # Log 5 plays (beyond limit of 3)
-    for i in range(5):
-        play_repo.log_play("test_client", videos[i % 2].id)
+    play_repo.log_plays_bulk([
+        {"client_id": "test_client", "video_id": videos[i % 2].id} for i in range(5)
+    ])
 
     # Act
     is_reached = service.is_limit_reached("test_client", today)
@@ -179,8 +181,9 @@ def test_limit_service_count_plays_today_returns_correct_count(setup_client):
     today = date.today()
 
     # Log 3 plays
-    for i in range(3):
-        play_repo.log_play("test_client", videos[i % 2].id)
+    play_repo.log_plays_bulk([
+        {"client_id": "test_client", "video_id": videos[i % 2].id} for i in range(3)
+    ])
 
     # Act
     count = service.count_plays_today("test_client", today)
@@ -98,6 +98,28 @@ def test_queue_repository_get_by_client(db_session):
     assert client1_queue[1].video_id == v2.id
 
 
+def test_queue_repository_get_by_client_loads_videos(db_session):
+    """Test that queue items come back with their videos already loaded."""
+    from src.db.repositories import QueueRepository, VideoRepository, ClientRepository
+
+    # Arrange
+    video_repo = VideoRepository(db_session)
+    v1 = video_repo.create(path="video1.mp4", title="Video 1")
+    v2 = video_repo.create(path="video2.mp4", title="Video 2")
+    ClientRepository(db_session).create(client_id="client1", friendly_name="Client 1")
+
+    queue_repo = QueueRepository(db_session)
+    queue_repo.add(client_id="client1", video_id=v1.id)
+    queue_repo.add(client_id="client1", video_id=v2.id)
+
+    # Act
+    queue = queue_repo.get_by_client("client1")
+    db_session.expunge_all()  # A lazy load would now raise
+
+    # Assert
+    assert [item.video.title for item in queue] == ["Video 1", "Video 2"]
+
+
 def test_queue_repository_get_by_client_returns_empty_list(db_session):
     """Test QueueRepository.get_by_client() returns empty list for client with no queue."""
     from src.db.repositories import QueueRepository, ClientRepository
@@ -321,6 +343,26 @@ def test_queue_repository_clear_only_affects_specified_client(db_session):
     assert len(client2_queue) == 1
 
 
+def test_queue_repository_add_appends_after_gap(db_session):
+    """Test QueueRepository.add() does not reuse a position after a removal."""
+    from src.db.repositories import QueueRepository, VideoRepository, ClientRepository
+
+    # Arrange
+    v1 = VideoRepository(db_session).create(path="video1.mp4", title="Video 1")
+    ClientRepository(db_session).create(client_id="test", friendly_name="Test", daily_limit=3)
+
+    queue_repo = QueueRepository(db_session)
+    first = queue_repo.add(client_id="test", video_id=v1.id)
+    queue_repo.add(client_id="test", video_id=v1.id)
+    queue_repo.remove(first.id)
+
+    # Act
+    item = queue_repo.add(client_id="test", video_id=v1.id)
+
+    # Assert
+    assert item.position == 3
+
+
 def test_queue_repository_reorder_updates_positions(db_session):
     """Test QueueRepository.reorder() updates queue item positions."""
     from src.db.repositories import QueueRepository, VideoRepository, ClientRepository
@@ -354,6 +396,28 @@ def test_queue_repository_reorder_updates_positions(db_session):
     assert queue[2].position == 3
 
 
+def test_queue_repository_reorder_ignores_other_clients_items(db_session):
+    """Test QueueRepository.reorder() leaves other clients' items untouched."""
+    from src.db.repositories import QueueRepository, VideoRepository, ClientRepository
+
+    # Arrange
+    v1 = VideoRepository(db_session).create(path="video1.mp4", title="Video 1")
+    client_repo = ClientRepository(db_session)
+    client_repo.create(client_id="test", friendly_name="Test", daily_limit=3)
+    client_repo.create(client_id="other", friendly_name="Other", daily_limit=3)
+
+    queue_repo = QueueRepository(db_session)
+    own = queue_repo.add(client_id="test", video_id=v1.id)
+    foreign = queue_repo.add(client_id="other", video_id=v1.id, position=7)
+
+    # Act
+    queue_repo.reorder("test", [foreign.id, own.id])
+
+    # Assert
+    assert queue_repo.get_by_client("test")[0].position == 2
+    assert queue_repo.get_by_client("other")[0].position == 7
+
+
 def test_queue_repository_pop_removes_and_returns_first_item(db_session):
     """Test QueueRepository.pop() removes and returns the first queue item."""
     from src.db.repositories import QueueRepository, VideoRepository, ClientRepository
@@ -384,6 +448,28 @@ def test_queue_repository_pop_removes_and_returns_first_item(db_session):
     assert remaining_queue[0].video_id == v2.id
 
 
+def test_queue_repository_pop_without_delete_returning(db_session, monkeypatch):
+    """Test that pop() falls back to SELECT + DELETE on older SQLite."""
+    from src.db.repositories import QueueRepository, VideoRepository, ClientRepository
+
+    # Arrange
+    v1 = VideoRepository(db_session).create(path="video1.mp4", title="Video 1")
+    v2 = VideoRepository(db_session).create(path="video2.mp4", title="Video 2")
+    ClientRepository(db_session).create(client_id="test", friendly_name="Test", daily_limit=3)
+
+    queue_repo = QueueRepository(db_session)
+    queue_repo.add(client_id="test", video_id=v1.id)
+    queue_repo.add(client_id="test", video_id=v2.id)
+    monkeypatch.setattr(db_session.get_bind().dialect, "delete_returning", False)
+
+    # Act
+    popped_item = queue_repo.pop("test")
+
+    # Assert
+    assert popped_item.video_id == v1.id
+    assert [item.video_id for item in queue_repo.get_by_client("test")] == [v2.id]
+
+
 def test_queue_repository_pop_returns_none_for_empty_queue(db_session):
     """Test that pop() returns None when queue is empty."""
     from src.db.repositories import QueueRepository, ClientRepository
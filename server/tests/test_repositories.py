@@ -64,6 +64,23 @@ def test_video_repository_get_all(db_session, sample_videos):
     assert all(hasattr(v, 'title') for v in videos)
 
 
+def test_video_repository_list_summary(db_session, sample_videos):
+    """Test listing video columns as plain rows sorted by title."""
+    from src.db.repositories import VideoRepository
+    from src.db.models import Video
+
+    # Arrange
+    repo = VideoRepository(db_session)
+
+    # Act
+    rows = repo.list_summary()
+
+    # Assert
+    assert [row.title for row in rows] == sorted(v.title for v in sample_videos)
+    assert not any(isinstance(row, Video) for row in rows)
+    assert {row.path for row in rows} == {v.path for v in sample_videos}
+
+
 def test_video_repository_get_by_id(db_session, sample_videos):
     """Test getting video by ID."""
     from src.db.repositories import VideoRepository
@@ -81,6 +98,90 @@ def test_video_repository_get_by_id(db_session, sample_videos):
     assert video.title == "Fun Cartoon 1"
 
 
+def test_video_repository_get_by_id_binds_each_call(db_session, sample_videos):
+    """Test that each call returns the video for its own ID, not the first."""
+    from src.db.repositories import VideoRepository
+
+    # Arrange
+    repo = VideoRepository(db_session)
+
+    # Act
+    videos = [repo.get_by_id(video.id) for video in sample_videos]
+
+    # Assert
+    assert [video.id for video in videos] == [video.id for video in sample_videos]
+
+
+def test_video_repository_get_by_path_binds_each_call(db_session, sample_videos):
+    """Test that each path lookup returns the video for its own path."""
+    from src.db.repositories import VideoRepository
+
+    # Arrange
+    repo = VideoRepository(db_session)
+
+    # Act
+    videos = [repo.get_by_path(video.path) for video in sample_videos]
+
+    # Assert
+    assert [video.id for video in videos] == [video.id for video in sample_videos]
+    assert repo.get_by_path("missing.mp4") is None
+
+
+def test_video_repository_get_by_id_uses_identity_map(db_session, sample_videos):
+    """Test that a video already loaded in the session is returned without SQL."""
+    from sqlalchemy import event
+    from src.db.repositories import VideoRepository
+
+    # Arrange
+    repo = VideoRepository(db_session)
+    loaded = repo.get_by_id(sample_videos[0].id)
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+
+    # Act
+    try:
+        video = repo.get_by_id(sample_videos[0].id)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    # Assert
+    assert video is loaded
+    assert statements == []
+
+
+def test_video_repository_create_stores_tag_rows(db_session):
+    """Test that creating a video also stores one VideoTag per tag."""
+    from src.db.repositories import VideoRepository
+
+    # Act
+    video = VideoRepository(db_session).create(
+        path="a.mp4", title="A", tags="cartoons, animals,cartoons"
+    )
+
+    # Assert
+    assert sorted(row.tag for row in video.tag_rows) == ["animals", "cartoons"]
+
+
+def test_video_repository_get_matching_tags(db_session):
+    """Test that tag matching is exact and matches any of the given tags."""
+    from src.db.repositories import VideoRepository
+
+    # Arrange
+    repo = VideoRepository(db_session)
+    cartoon = repo.create(path="c.mp4", title="C", tags="cartoons")
+    animal = repo.create(path="a.mp4", title="A", tags="animals,bedtime")
+    repo.create(path="e.mp4", title="E", tags="educational")
+    repo.create(path="n.mp4", title="N")
+
+    # Act
+    videos = repo.get_matching_tags(["cartoons", "bedtime", "cart"])
+
+    # Assert
+    assert sorted(v.id for v in videos) == sorted([cartoon.id, animal.id])
+
+
 def test_video_repository_get_by_id_not_found(db_session):
     """Test getting non-existent video returns None."""
     from src.db.repositories import VideoRepository
@@ -131,6 +232,23 @@ def test_video_repository_create(db_session):
     assert video.tags == "kids,fun"
 
 
+def test_video_repository_create_and_delete_without_commit(db_session, sample_videos):
+    """Test that commit=False leaves the changes to the caller's transaction."""
+    from src.db.repositories import VideoRepository
+
+    # Arrange
+    repo = VideoRepository(db_session)
+
+    # Act
+    repo.create(path="new/video.mp4", title="New Video", commit=False)
+    repo.delete(sample_videos[0].id, commit=False)
+    db_session.rollback()
+
+    # Assert
+    assert repo.get_by_path("new/video.mp4") is None
+    assert len(repo.get_all()) == len(sample_videos)
+
+
 def test_video_repository_get_random(db_session, sample_videos):
     """Test getting a random video."""
     from src.db.repositories import VideoRepository
@@ -253,6 +371,31 @@ def test_client_repository_get_or_create_new(db_session):
     assert client.daily_limit == 3  # Default
 
 
+def test_client_repository_get_or_create_loses_race(db_session, monkeypatch):
+    """Test get_or_create returns the row a concurrent request inserted."""
+    from src.db.repositories import ClientRepository
+
+    # Arrange - The client appears between the lookup and the insert
+    repo = ClientRepository(db_session)
+    repo.create(client_id="raced", friendly_name="Winner", daily_limit=5)
+    real_get_by_id = repo.get_by_id
+    calls = []
+
+    def get_by_id(client_id):
+        calls.append(client_id)
+        return None if len(calls) == 1 else real_get_by_id(client_id)
+
+    monkeypatch.setattr(repo, "get_by_id", get_by_id)
+
+    # Act
+    client = repo.get_or_create("raced", friendly_name="Loser")
+
+    # Assert
+    assert len(calls) == 2
+    assert client.friendly_name == "Winner"
+    assert client.daily_limit == 5
+
+
 def test_client_repository_update(db_session):
     """Test updating client settings."""
     from src.db.repositories import ClientRepository
@@ -273,6 +416,144 @@ def test_client_repository_update(db_session):
     assert updated.friendly_name == "Updated"
 
 
+def test_client_repository_update_not_found(db_session):
+    """Test updating a non-existent client returns None."""
+    from src.db.repositories import ClientRepository
+
+    # Act
+    updated = ClientRepository(db_session).update("missing", daily_limit=5)
+
+    # Assert
+    assert updated is None
+
+
+def test_client_repository_add_bonus_plays_accumulates_same_day(db_session):
+    """Test bonus plays add up on the same date and reset on a new date."""
+    from src.db.repositories import ClientRepository
+
+    # Arrange
+    repo = ClientRepository(db_session)
+    repo.create(client_id="test", friendly_name="Test")
+    yesterday = date.today() - timedelta(days=1)
+    repo.add_bonus_plays("test", bonus_count=4, bonus_date=yesterday)
+
+    # Act
+    first = repo.add_bonus_plays("test", bonus_count=2, bonus_date=date.today())
+    first_count = first.bonus_plays_count
+    second = repo.add_bonus_plays("test", bonus_count=3, bonus_date=date.today())
+
+    # Assert
+    assert first_count == 2
+    assert second.bonus_plays_count == 5
+    assert second.bonus_plays_date == date.today()
+
+
+def test_client_repository_add_bonus_plays_not_found(db_session):
+    """Test adding bonus plays to a non-existent client returns None."""
+    from src.db.repositories import ClientRepository
+
+    # Act
+    updated = ClientRepository(db_session).add_bonus_plays("missing", 1, date.today())
+
+    # Assert
+    assert updated is None
+
+
+def test_client_repository_settings_snapshot_is_cached(db_session):
+    """Test that a settings snapshot is served from cache within the TTL."""
+    from src.db.repositories import ClientRepository
+    from src.db.models import ClientSettings
+
+    # Arrange
+    client = ClientSettings(client_id="test", friendly_name="Test", daily_limit=3)
+    db_session.add(client)
+    db_session.commit()
+
+    repo = ClientRepository(db_session)
+    first = repo.get_settings_snapshot("test")
+
+    # Change the row behind the repository's back
+    client.daily_limit = 7
+    db_session.commit()
+
+    # Act
+    second = repo.get_settings_snapshot("test")
+
+    # Assert
+    assert first.daily_limit == 3
+    assert second is first
+
+
+def test_client_repository_update_invalidates_settings_snapshot(db_session):
+    """Test that updating a client refreshes its cached snapshot."""
+    from src.db.repositories import ClientRepository
+
+    # Arrange
+    repo = ClientRepository(db_session)
+    repo.create(client_id="test", friendly_name="Test", daily_limit=3)
+    repo.get_settings_snapshot("test")
+
+    # Act
+    repo.update("test", daily_limit=5)
+    repo.add_bonus_plays("test", bonus_count=2, bonus_date=date.today())
+    snapshot = repo.get_settings_snapshot("test")
+
+    # Assert
+    assert snapshot.daily_limit == 5
+    assert snapshot.bonus_plays_count == 2
+    assert snapshot.bonus_plays_date == date.today()
+
+
+def test_client_repository_update_during_refill_is_not_overwritten(db_session, monkeypatch):
+    """Test that a refill racing an update doesn't cache the pre-update row."""
+    from src.db.repositories import ClientRepository
+
+    # Arrange
+    repo = ClientRepository(db_session)
+    repo.create(client_id="test", friendly_name="Test", daily_limit=3)
+    execute = db_session.execute
+
+    def select_then_update(statement, *args, **kwargs):
+        # The refill reads the old row, then another request updates it
+        row = execute(statement, *args, **kwargs).first()
+        monkeypatch.setattr(db_session, "execute", execute)
+        ClientRepository(db_session).update("test", daily_limit=5)
+        return type("Result", (), {"first": lambda self: row})()
+
+    monkeypatch.setattr(db_session, "execute", select_then_update)
+
+    # Act
+    stale = repo.get_settings_snapshot("test")
+    fresh = repo.get_settings_snapshot("test")
+
+    # Assert
+    assert stale.daily_limit == 3
+    assert fresh.daily_limit == 5
+
+
+def test_client_repository_settings_snapshot_not_found(db_session):
+    """Test that an unknown client has no settings snapshot."""
+    from src.db.repositories import ClientRepository
+
+    # Act
+    snapshot = ClientRepository(db_session).get_settings_snapshot("missing")
+
+    # Assert
+    assert snapshot is None
+
+
+def test_day_bounds_is_half_open_and_cached():
+    """Test that day bounds run from midnight to the next midnight."""
+    from src.db.repositories import day_bounds
+
+    # Act
+    bounds = day_bounds(date(2024, 2, 28))
+
+    # Assert
+    assert bounds == (datetime(2024, 2, 28), datetime(2024, 2, 29))
+    assert day_bounds(date(2024, 2, 28)) is bounds
+
+
 # ===== PlayLogRepository Tests =====
 
 def test_playlog_repository_log_play(db_session, sample_videos):
@@ -297,6 +578,48 @@ def test_playlog_repository_log_play(db_session, sample_videos):
     assert play.video_id == sample_videos[0].id
 
 
+def test_playlog_repository_log_plays_bulk(db_session, sample_videos):
+    """Test inserting many plays at once with default columns filled in."""
+    from src.db.repositories import PlayLogRepository, ClientRepository
+
+    # Arrange
+    ClientRepository(db_session).create(client_id="test", friendly_name="Test")
+    repo = PlayLogRepository(db_session)
+    rows = [{"client_id": "test", "video_id": video.id} for video in sample_videos]
+
+    # Act
+    repo.log_plays_bulk(rows)
+    repo.log_plays_bulk([])
+
+    # Assert
+    plays = repo.get_recent_plays("test")
+    assert len(plays) == len(sample_videos)
+    assert all(play.played_at is not None and play.completed is False for play in plays)
+
+
+def test_playlog_repository_log_play_safe_returns_none_on_error(db_session, monkeypatch):
+    """Test that a failed insert is logged once and not raised or retried."""
+    from sqlalchemy.exc import OperationalError
+    from src.db.repositories import PlayLogRepository
+
+    # Arrange
+    repo = PlayLogRepository(db_session)
+    calls = []
+
+    def failing_log_play(**kwargs):
+        calls.append(kwargs)
+        raise OperationalError("INSERT", {}, Exception("database is locked"))
+
+    monkeypatch.setattr(repo, "log_play", failing_log_play)
+
+    # Act
+    play = repo.log_play_safe(client_id="test", video_id=1)
+
+    # Assert
+    assert play is None
+    assert len(calls) == 1
+
+
 def test_playlog_repository_count_plays_today(db_session, sample_videos):
     """Test counting plays for today."""
     from src.db.repositories import PlayLogRepository, ClientRepository
@@ -365,6 +688,69 @@ def test_playlog_repository_excludes_previous_days(db_session, sample_videos):
     assert count == 1  # Only today's play
 
 
+def test_playlog_repository_excludes_next_midnight(db_session, sample_videos):
+    """Test that a play at the start of the next day is not counted."""
+    from src.db.repositories import PlayLogRepository, ClientRepository
+    from src.db.models import PlayLog
+
+    # Arrange
+    ClientRepository(db_session).create(client_id="test", friendly_name="Test")
+    day = date(2024, 1, 15)
+    db_session.add_all([
+        PlayLog(client_id="test", video_id=sample_videos[0].id,
+                played_at=datetime(2024, 1, 15, 23, 59, 59, 999999)),
+        PlayLog(client_id="test", video_id=sample_videos[1].id,
+                played_at=datetime(2024, 1, 16)),
+    ])
+    db_session.commit()
+
+    # Act
+    count = PlayLogRepository(db_session).count_plays_today("test", day)
+
+    # Assert
+    assert count == 1
+
+
+def test_playlog_repository_get_play_counts(db_session, sample_videos):
+    """Test counting all-time and today's plays together."""
+    from src.db.repositories import PlayLogRepository, ClientRepository
+    from src.db.models import PlayLog
+
+    # Arrange
+    client_repo = ClientRepository(db_session)
+    client_repo.create(client_id="test", friendly_name="Test")
+    client_repo.create(client_id="other", friendly_name="Other")
+
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    db_session.add_all([
+        PlayLog(client_id="test", video_id=sample_videos[0].id, played_at=yesterday),
+        PlayLog(client_id="test", video_id=sample_videos[1].id, played_at=datetime.utcnow()),
+        PlayLog(client_id="test", video_id=sample_videos[2].id, played_at=datetime.utcnow()),
+        PlayLog(client_id="other", video_id=sample_videos[0].id, played_at=datetime.utcnow()),
+    ])
+    db_session.commit()
+
+    repo = PlayLogRepository(db_session)
+
+    # Act
+    total, plays_today = repo.get_play_counts("test", date.today())
+
+    # Assert
+    assert total == 3
+    assert plays_today == 2
+
+
+def test_playlog_repository_get_play_counts_no_plays(db_session):
+    """Test that a client without plays gets zero counts."""
+    from src.db.repositories import PlayLogRepository
+
+    # Act
+    counts = PlayLogRepository(db_session).get_play_counts("nobody", date.today())
+
+    # Assert
+    assert counts == (0, 0)
+
+
 def test_playlog_repository_get_recent_plays(db_session, sample_videos):
     """Test getting recent plays for a client."""
     from src.db.repositories import PlayLogRepository, ClientRepository
@@ -392,3 +778,49 @@ def test_playlog_repository_get_recent_plays(db_session, sample_videos):
     assert len(recent) == 3
     # Should be ordered by most recent first
     assert recent[0].id > recent[1].id
+
+
+def test_playlog_repository_get_recent_plays_loads_videos(db_session, sample_videos):
+    """Test that recent plays come back with their videos already loaded."""
+    from src.db.repositories import PlayLogRepository, ClientRepository
+
+    # Arrange
+    ClientRepository(db_session).create(client_id="test", friendly_name="Test")
+    repo = PlayLogRepository(db_session)
+    repo.log_plays_bulk([{"client_id": "test", "video_id": v.id} for v in sample_videos])
+
+    # Act
+    plays = repo.get_recent_plays("test")
+    db_session.expunge_all()  # A lazy load would now raise
+
+    # Assert
+    assert {play.video.title for play in plays} == {v.title for v in sample_videos}
+
+
+def test_playlog_repository_get_recent_plays_before(db_session, sample_videos):
+    """Test paging through plays with a played_at cursor."""
+    from src.db.repositories import PlayLogRepository, ClientRepository
+    from src.db.models import PlayLog
+
+    # Arrange
+    ClientRepository(db_session).create(client_id="test", friendly_name="Test")
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    for i in range(5):
+        db_session.add(PlayLog(
+            client_id="test",
+            video_id=sample_videos[0].id,
+            played_at=start + timedelta(minutes=i)
+        ))
+    db_session.commit()
+
+    repo = PlayLogRepository(db_session)
+
+    # Act
+    first_page = repo.get_recent_plays("test", limit=2)
+    second_page = repo.get_recent_plays("test", limit=2, before=first_page[-1].played_at)
+    last_page = repo.get_recent_plays("test", limit=2, before=start)
+
+    # Assert
+    assert [p.played_at.minute for p in first_page] == [4, 3]
+    assert [p.played_at.minute for p in second_page] == [2, 1]
+    assert last_page == []